@@ -1,36 +1,87 @@
 """MySQL Monitor Integration for Home Assistant."""
+import asyncio
 import logging
+import time
 from datetime import timedelta
-from decimal import Decimal
+from typing import Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN, 
+    DEFAULT_HEAVY_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    SECTION_TTLS,
+    STATIC_DATA_TTL,
     CONF_ENABLE_QUERY_CACHE,
     CONF_ENABLE_REPLICATION,
+    CONF_ENABLE_BUFFER_POOL_DETAIL,
+    CONF_DB_MIN_SIZE_BYTES,
+    CONF_LEGACY_SPLIT_DB_SENSORS,
+    CONF_EXCLUDE_DBS,
+    CONF_HEAVY_SCAN_INTERVAL,
+    CONF_INCLUDE_DBS,
+    CONF_SCAN_INTERVAL,
+    CONNECTION_ERROR_METRICS,
+    METRIC_CATEGORIES,
+    QUERY_CACHE_METRICS,
+    REPLICATION_METRICS,
+    SYSTEM_DATABASE_SET,
 )
-from .mysql_client import MySQLClient
+from .mysql_client import MySQLClient, SystemResources, is_connection_error
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR]
 
+# Sections whose empty value is not a plain dict; used when a collector fails
+_SECTION_DEFAULTS = {
+    "process_list": list,
+    "system_resources": SystemResources,
+    "query_cache": lambda: {"enabled": False},
+}
+# Every key of the coordinator payload, so the dict is sized once up front
+_DATA_KEYS = (
+    "server_info",
+    "global_variables",
+    "global_status",
+    "global_status_num",
+    "innodb_status",
+    "performance_data",
+    "process_list",
+    "system_resources",
+    "binlog_info",
+    "connection_pool",
+    "slow_queries",
+    "lock_waits",
+    "buffer_pool",
+    "transactions",
+    "storage_engines",
+    "database_sizes",
+    "table_stats",
+    "replication_status",
+    "query_cache",
+    "features",
+)
+_STATIC_SECTIONS = frozenset({"server_info"})
+_HEAVY_SECTIONS = frozenset({"database_sizes", "table_stats", "storage_engines"})
+
 
-def convert_decimal(obj):
-    """Convert Decimal objects to float for JSON serialization."""
-    if isinstance(obj, Decimal):
-        return float(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_decimal(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_decimal(item) for item in obj]
-    return obj
+def _maybe_number(value):
+    """Return a status value as int or float, or None if it is not numeric."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -48,13 +99,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ssl_verify=entry.data.get("ssl_verify", True),
     )
     
-    # Test connection
-    try:
-        await hass.async_add_executor_job(client.test_connection)
-    except Exception as err:
-        _LOGGER.error("Failed to connect to MySQL: %s", err)
-        raise ConfigEntryNotReady(f"Unable to connect to MySQL: {err}") from err
-    
     # Create coordinator
     coordinator = MySQLDataCoordinator(
         hass,
@@ -62,8 +106,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry,
     )
     
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data; this doubles as the connectivity check. The
+    # status snapshot or a connection error fails the refresh, which
+    # raises ConfigEntryNotReady so Home Assistant retries the setup
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await hass.async_add_executor_job(client.close)
+        raise
     
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -72,8 +122,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    # Reload entry when options updated
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # Apply options when updated
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     
     return True
 
@@ -90,15 +140,49 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options, reloading only when the sensor set changes."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    
+    if coordinator.requires_reload(entry):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    
+    coordinator.apply_options(entry.options)
+    # The pending poll was scheduled with the old interval; refreshing now
+    # reschedules it with the new one
+    await coordinator.async_request_refresh()
 
 
 class MySQLDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching MySQL data."""
     
+    # DataUpdateCoordinator itself has no __slots__, so instances keep a
+    # __dict__ for base-class state; our own attributes use slot descriptors
+    __slots__ = (
+        "client",
+        "entry",
+        "device_info",
+        "_entry_data",
+        "_db_filters",
+        "include_dbs",
+        "exclude_dbs",
+        "enable_query_cache",
+        "enable_replication",
+        "buffer_pool_detail",
+        "db_min_size",
+        "registered_dbs",
+        "split_db_sensors",
+        "active_categories",
+        "_static_cache",
+        "_static_cache_ts",
+        "heavy_scan_interval",
+        "_heavy_cache",
+        "_heavy_ts",
+        "_section_cache",
+        "update_version",
+    )
+    
     def __init__(
         self,
         hass: HomeAssistant,
@@ -109,24 +193,81 @@ class MySQLDataCoordinator(DataUpdateCoordinator):
         self.client = client
         self.entry = entry
         
+        # Built once per entry and shared by all of its sensors
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"MySQL {entry.data['host']}:{entry.data['port']}",
+            manufacturer="Pages in Korea (pages.kr)",
+            model="MySQL Server",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        
+        # Connection settings and options that define the sensor set;
+        # changing any of these requires a full reload
+        self._entry_data = dict(entry.data)
+        self._db_filters = (
+            entry.options.get(CONF_INCLUDE_DBS, ""),
+            entry.options.get(CONF_EXCLUDE_DBS, ""),
+        )
+        
         # Get options
         scan_interval = entry.options.get(
-            "scan_interval", DEFAULT_SCAN_INTERVAL
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
-        self.include_dbs = [
+        self.include_dbs = frozenset(
             db.strip() 
-            for db in entry.options.get("include_dbs", "").split(",") 
+            for db in entry.options.get(CONF_INCLUDE_DBS, "").split(",") 
             if db.strip()
-        ]
-        self.exclude_dbs = [
+        )
+        # Effective exclude set: system schemas plus the user's list
+        self.exclude_dbs = SYSTEM_DATABASE_SET | frozenset(
             db.strip() 
-            for db in entry.options.get("exclude_dbs", "").split(",") 
+            for db in entry.options.get(CONF_EXCLUDE_DBS, "").split(",") 
             if db.strip()
-        ]
+        )
+        
+        # Databases get sensors once they reach the minimum size; the
+        # sensor platform records which ones it has added
+        self.db_min_size = entry.options.get(CONF_DB_MIN_SIZE_BYTES, 0)
+        self.registered_dbs = set()
+        # Entries created before the option existed keep their split sensors
+        self.split_db_sensors = entry.options.get(CONF_LEGACY_SPLIT_DB_SENSORS, True)
         
         # Feature flags
         self.enable_query_cache = entry.options.get(CONF_ENABLE_QUERY_CACHE, False)
         self.enable_replication = entry.options.get(CONF_ENABLE_REPLICATION, False)
+        self.buffer_pool_detail = entry.options.get(
+            CONF_ENABLE_BUFFER_POOL_DETAIL, False
+        )
+        
+        # Global status categories monitored for this entry
+        self.active_categories = {**METRIC_CATEGORIES}
+        if self.enable_query_cache:
+            self.active_categories["cache"] = QUERY_CACHE_METRICS
+        if self.enable_replication:
+            self.active_categories["replication"] = REPLICATION_METRICS
+        
+        # Server info changes on the order of days; None means never
+        # fetched (monotonic time can be small right after boot)
+        self._static_cache = {}
+        self._static_cache_ts: Optional[float] = None
+        
+        # Database sizes, table statistics and storage engine totals scan
+        # information_schema, the heaviest queries, so they are refreshed
+        # less often
+        self.heavy_scan_interval = entry.options.get(
+            CONF_HEAVY_SCAN_INTERVAL, DEFAULT_HEAVY_SCAN_INTERVAL
+        )
+        # Each heavy section has its own last good value and last attempt
+        # time; a section missing from _heavy_ts has never been queried
+        self._heavy_cache = {}
+        self._heavy_ts = {}
+        
+        # (timestamp, value) for sections throttled by SECTION_TTLS
+        self._section_cache = {}
+        
+        # Bumped once per successful refresh; sensors key their caches on it
+        self.update_version = 0
         
         super().__init__(
             hass,
@@ -135,95 +276,204 @@ class MySQLDataCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=scan_interval),
         )
     
+    def requires_reload(self, entry: ConfigEntry) -> bool:
+        """Return True if an entry update cannot be applied in place."""
+        options = entry.options
+        return (
+            dict(entry.data) != self._entry_data
+            or (
+                options.get(CONF_INCLUDE_DBS, ""),
+                options.get(CONF_EXCLUDE_DBS, ""),
+            ) != self._db_filters
+            or options.get(CONF_DB_MIN_SIZE_BYTES, 0) != self.db_min_size
+            or options.get(CONF_LEGACY_SPLIT_DB_SENSORS, True) != self.split_db_sensors
+            or options.get(CONF_ENABLE_QUERY_CACHE, False) != self.enable_query_cache
+            or options.get(CONF_ENABLE_REPLICATION, False) != self.enable_replication
+        )
+    
+    def apply_options(self, options) -> None:
+        """Apply options that do not change the set of sensors."""
+        self.update_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.heavy_scan_interval = options.get(
+            CONF_HEAVY_SCAN_INTERVAL, DEFAULT_HEAVY_SCAN_INTERVAL
+        )
+        self.buffer_pool_detail = options.get(CONF_ENABLE_BUFFER_POOL_DETAIL, False)
+    
     async def _async_update_data(self):
         """Fetch data from MySQL."""
+        # Each collector runs in its own executor job on a pooled
+        # connection, so the refresh takes as long as the slowest query
+        now = time.monotonic()
+        refresh_static = (
+            self._static_cache_ts is None
+            or now - self._static_cache_ts > STATIC_DATA_TTL
+        )
+        heavy_due = {
+            key
+            for key in _HEAVY_SECTIONS
+            if key not in self._heavy_ts
+            or now - self._heavy_ts[key] >= self.heavy_scan_interval
+        }
+        
+        # Global status and variables are taken first in one round-trip;
+        # the collectors below read settings and counters from them. Every
+        # sensor depends on this, so a failure here fails the refresh.
         try:
-            data = await self.hass.async_add_executor_job(
-                self._fetch_data
+            status, variables = await self.hass.async_add_executor_job(
+                self.client.refresh_snapshots
             )
-            # Convert all Decimal objects to float
-            return convert_decimal(data)
         except Exception as err:
-            _LOGGER.error("Error fetching MySQL data: %s", err)
+            self._static_cache_ts = None
             raise UpdateFailed(f"Error communicating with MySQL: {err}") from err
-    
-    def _fetch_data(self):
-        """Fetch all MySQL data."""
-        data = {}
         
-        try:
-            # Get server info
-            data["server_info"] = self.client.get_server_info()
-            
-            # Get global status
-            data["global_status"] = self.client.get_global_status()
-            
-            # Get global variables
-            data["global_variables"] = self.client.get_global_variables()
-            
-            # Get InnoDB status
-            data["innodb_status"] = self.client.get_innodb_status()
-            
-            # Get performance schema data
-            data["performance_data"] = self.client.get_performance_data()
-            
-            # Get process list
-            data["process_list"] = self.client.get_process_list()
-            
-            # Get replication status (conditional)
-            if self.enable_replication:
-                data["replication_status"] = self.client.get_replication_status()
-            else:
-                data["replication_status"] = {}
-            
-            # Get system resource usage
-            data["system_resources"] = self.client.get_system_resources()
-            
-            # Get database sizes
-            data["database_sizes"] = self.client.get_database_sizes(
-                self.include_dbs, self.exclude_dbs
+        calls = {
+            "innodb_status": (self.client.get_innodb_status,),
+            "performance_data": (self.client.get_performance_data,),
+            "process_list": (self.client.get_process_list,),
+            "system_resources": (self.client.get_system_resources,),
+            "binlog_info": (self.client.get_binlog_info,),
+            "connection_pool": (self.client.get_connection_pool_stats,),
+            "slow_queries": (self.client.get_slow_query_stats,),
+            "lock_waits": (self.client.get_lock_wait_stats,),
+            "buffer_pool": (
+                self.client.get_buffer_pool_stats, self.buffer_pool_detail
+            ),
+            "transactions": (self.client.get_transaction_info,),
+        }
+        
+        # Nearly static data is only re-queried once the cache expires
+        if refresh_static:
+            calls["server_info"] = (self.client.get_server_info,)
+        if "database_sizes" in heavy_due:
+            calls["database_sizes"] = (
+                self.client.get_database_sizes, self.include_dbs, self.exclude_dbs
             )
-            
-            # Get table statistics
-            data["table_stats"] = self.client.get_table_statistics(
-                self.include_dbs, self.exclude_dbs
+        if "table_stats" in heavy_due:
+            calls["table_stats"] = (
+                self.client.get_table_statistics, self.include_dbs, self.exclude_dbs
             )
-            
-            # Get query cache info (conditional)
-            if self.enable_query_cache:
-                data["query_cache"] = self.client.get_query_cache_info()
-            else:
-                data["query_cache"] = {"enabled": False}
-            
-            # Get binary log info
-            data["binlog_info"] = self.client.get_binlog_info()
-            
-            # Get connection pool stats
-            data["connection_pool"] = self.client.get_connection_pool_stats()
-            
-            # Get slow query stats
-            data["slow_queries"] = self.client.get_slow_query_stats()
-            
-            # Get table lock waits
-            data["lock_waits"] = self.client.get_lock_wait_stats()
-            
-            # Get buffer pool stats
-            data["buffer_pool"] = self.client.get_buffer_pool_stats()
-            
-            # Get transaction info
-            data["transactions"] = self.client.get_transaction_info()
-            
-            # Get storage engine stats
-            data["storage_engines"] = self.client.get_storage_engine_stats()
-            
-            # Store feature flags
-            data["features"] = {
-                "query_cache": self.enable_query_cache,
-                "replication": self.enable_replication,
+        if "storage_engines" in heavy_due:
+            calls["storage_engines"] = (self.client.get_storage_engine_stats,)
+        
+        # Conditional collectors
+        if self.enable_replication:
+            calls["replication_status"] = (self.client.get_replication_status,)
+        if self.enable_query_cache:
+            calls["query_cache"] = (self.client.get_query_cache_info,)
+        
+        # Slow-moving sections are served from cache until their TTL runs
+        # out. Half a scan interval of slack keeps a poll that fires a
+        # little early from pushing the refresh back a whole cycle.
+        slack = self.update_interval.total_seconds() / 2
+        for key, ttl in SECTION_TTLS.items():
+            cached = self._section_cache.get(key)
+            if cached and now - cached[0] < ttl - slack:
+                calls.pop(key, None)
+        
+        results = await asyncio.gather(
+            *(self.hass.async_add_executor_job(*call) for call in calls.values()),
+            return_exceptions=True,
+        )
+        
+        data = dict.fromkeys(_DATA_KEYS)
+        data["replication_status"] = {}
+        data["query_cache"] = {"enabled": False}
+        data["global_status"] = status
+        data["global_variables"] = variables
+        # A single failing collector (e.g. no InnoDB, missing privileges)
+        # only empties its own section; losing the server fails the refresh
+        failed = set()
+        for key, result in zip(calls, results):
+            if isinstance(result, Exception):
+                if is_connection_error(result):
+                    self._static_cache_ts = None
+                    raise UpdateFailed(
+                        f"Error communicating with MySQL: {result}"
+                    ) from result
+                _LOGGER.debug("Skipping MySQL %s: %s", key, result)
+                failed.add(key)
+                result = _SECTION_DEFAULTS.get(key, dict)()
+            data[key] = result
+        
+        # A failed static section is not cached, so it is retried on the
+        # next refresh while the previous value stays in use
+        if refresh_static and not failed & _STATIC_SECTIONS:
+            self._static_cache = {
+                "server_info": data["server_info"],
             }
-            
-        except Exception as err:
-            _LOGGER.error("Error in _fetch_data: %s", err)
-            raise
+            self._static_cache_ts = now
+        elif self._static_cache:
+            # Uptime and server time keep moving while the rest is cached
+            server_info = dict(self._static_cache["server_info"])
+            try:
+                server_info["uptime"] = int(data["global_status"]["Uptime"])
+            except (KeyError, ValueError, TypeError):
+                pass
+            if server_info.get("current_time"):
+                server_info["current_time"] += timedelta(
+                    seconds=now - self._static_cache_ts
+                )
+            data["server_info"] = server_info
+        
+        # Human readable uptime, formatted once per refresh
+        server_info = data.get("server_info")
+        if server_info and server_info.get("uptime"):
+            days, rem = divmod(server_info["uptime"], 86400)
+            hours, rem = divmod(rem, 3600)
+            server_info["uptime_formatted"] = f"{days}d {hours}h {rem // 60}m"
+        
+        if "table_stats" in calls and "table_stats" not in failed:
+            # Largest tables grouped per schema for the database sensors
+            table_stats = data["table_stats"]
+            buckets = {}
+            for table in table_stats.get("largest_tables", []):
+                buckets.setdefault(table.get("table_schema"), []).append(table)
+            table_stats["largest_by_schema"] = {
+                schema: tables[:5] for schema, tables in buckets.items()
+            }
+        
+        # A failed heavy section backs off until its next interval like a
+        # successful one, keeping its last good value meanwhile
+        for key in _HEAVY_SECTIONS:
+            if key in calls:
+                self._heavy_ts[key] = now
+                if key not in failed:
+                    self._heavy_cache[key] = data[key]
+                    continue
+            data[key] = self._heavy_cache.get(key) or data[key] or {}
+        
+        for key in SECTION_TTLS:
+            if key in calls:
+                if key not in failed:
+                    self._section_cache[key] = (now, data[key])
+            elif key in self._section_cache:
+                data[key] = self._section_cache[key][1]
+        
+        # Store feature flags
+        data["features"] = {
+            "query_cache": self.enable_query_cache,
+            "replication": self.enable_replication,
+        }
+        
+        # Status counters are cast once here instead of in every sensor
+        status_num = {k: _maybe_number(v) for k, v in data["global_status"].items()}
+        # Error counters are always present so sensors can sum them directly
+        for metric in CONNECTION_ERROR_METRICS:
+            if status_num.get(metric) is None:
+                status_num[metric] = 0
+        data["global_status_num"] = status_num
+        
+        # Only build the summary when debug logging is actually enabled
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "MySQL refresh took %.3fs (static=%s, heavy=%s): %s",
+                time.monotonic() - now,
+                refresh_static,
+                ",".join(sorted(heavy_due)) or "none",
+                ", ".join(calls),
+            )
         
+        self.update_version += 1
         return data
@@ -16,6 +16,7 @@ from homeassistant.helpers import config_validation as cv
 
 from .const import (
     CONF_EXCLUDE_DBS,
+    CONF_HEAVY_SCAN_INTERVAL,
     CONF_INCLUDE_DBS,
     CONF_SCAN_INTERVAL,
     CONF_SSL_CA,
@@ -23,6 +24,10 @@ from .const import (
     CONF_USE_SSL,
     CONF_ENABLE_QUERY_CACHE,
     CONF_ENABLE_REPLICATION,
+    CONF_ENABLE_BUFFER_POOL_DETAIL,
+    CONF_DB_MIN_SIZE_BYTES,
+    CONF_LEGACY_SPLIT_DB_SENSORS,
+    DEFAULT_HEAVY_SCAN_INTERVAL,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
@@ -31,6 +36,38 @@ from .mysql_client import MySQLClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Schemas are built once at import; option defaults are filled in per render
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_HOST): str,
+    vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
+    vol.Required(CONF_USERNAME): str,
+    vol.Required(CONF_PASSWORD): str,
+    vol.Optional(CONF_USE_SSL, default=False): bool,
+    vol.Optional(CONF_SSL_CA): str,
+    vol.Optional(CONF_SSL_VERIFY, default=True): bool,
+})
+
+_OPTIONS_SCHEMA = vol.Schema({
+    vol.Optional(CONF_INCLUDE_DBS, default=""): str,
+    vol.Optional(CONF_EXCLUDE_DBS, default=""): str,
+    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=10, max=3600)
+    ),
+    vol.Optional(CONF_HEAVY_SCAN_INTERVAL, default=DEFAULT_HEAVY_SCAN_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=10, max=86400)
+    ),
+    # Databases smaller than this get no sensors
+    vol.Optional(CONF_DB_MIN_SIZE_BYTES, default=0): vol.All(
+        vol.Coerce(int), vol.Range(min=0)
+    ),
+    # Three sensors per database instead of one size sensor with attributes
+    vol.Optional(CONF_LEGACY_SPLIT_DB_SENSORS, default=False): bool,
+    vol.Optional(CONF_ENABLE_QUERY_CACHE, default=False): bool,
+    vol.Optional(CONF_ENABLE_REPLICATION, default=False): bool,
+    # Per-instance buffer pool rows; the view is costly on large pools
+    vol.Optional(CONF_ENABLE_BUFFER_POOL_DETAIL, default=False): bool,
+})
+
 
 class MySQLMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for MySQL Monitor."""
@@ -72,8 +109,12 @@ class MySQLMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_INCLUDE_DBS: "",
                         CONF_EXCLUDE_DBS: "",
                         CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+                        CONF_HEAVY_SCAN_INTERVAL: DEFAULT_HEAVY_SCAN_INTERVAL,
+                        CONF_DB_MIN_SIZE_BYTES: 0,
+                        CONF_LEGACY_SPLIT_DB_SENSORS: False,
                         CONF_ENABLE_QUERY_CACHE: False,
                         CONF_ENABLE_REPLICATION: False,
+                        CONF_ENABLE_BUFFER_POOL_DETAIL: False,
                     },
                 )
             except Exception as err:
@@ -83,19 +124,9 @@ class MySQLMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.hass.async_add_executor_job(client.close)
         
         # Show form
-        data_schema = vol.Schema({
-            vol.Required(CONF_HOST): str,
-            vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
-            vol.Required(CONF_USERNAME): str,
-            vol.Required(CONF_PASSWORD): str,
-            vol.Optional(CONF_USE_SSL, default=False): bool,
-            vol.Optional(CONF_SSL_CA): str,
-            vol.Optional(CONF_SSL_VERIFY, default=True): bool,
-        })
-        
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
     
@@ -119,30 +150,13 @@ class MySQLMonitorOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
         
-        data_schema = vol.Schema({
-            vol.Optional(
-                CONF_INCLUDE_DBS,
-                default=self.config_entry.options.get(CONF_INCLUDE_DBS, ""),
-            ): str,
-            vol.Optional(
-                CONF_EXCLUDE_DBS,
-                default=self.config_entry.options.get(CONF_EXCLUDE_DBS, ""),
-            ): str,
-            vol.Optional(
-                CONF_SCAN_INTERVAL,
-                default=self.config_entry.options.get(
-                    CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                ),
-            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
-            vol.Optional(
-                CONF_ENABLE_QUERY_CACHE,
-                default=self.config_entry.options.get(CONF_ENABLE_QUERY_CACHE, False),
-            ): bool,
-            vol.Optional(
-                CONF_ENABLE_REPLICATION,
-                default=self.config_entry.options.get(CONF_ENABLE_REPLICATION, False),
-            ): bool,
-        })
+        # Entries created before the legacy split option existed run with
+        # split sensors (see MySQLDataCoordinator); show that, not the
+        # schema default, so saving the form keeps them
+        data_schema = self.add_suggested_values_to_schema(
+            _OPTIONS_SCHEMA,
+            {CONF_LEGACY_SPLIT_DB_SENSORS: True, **self.config_entry.options},
+        )
         
         return self.async_show_form(
             step_id="init",
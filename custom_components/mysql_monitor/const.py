@@ -5,6 +5,35 @@ DOMAIN = "mysql_monitor"
 # Default values
 DEFAULT_PORT = 3306
 DEFAULT_SCAN_INTERVAL = 60
+DEFAULT_HEAVY_SCAN_INTERVAL = 300
+DEFAULT_POOL_SIZE = 4
+
+# Cache lifetime (seconds) for server info
+STATIC_DATA_TTL = 600
+
+# Minimum age (seconds) before a slow-moving section is queried again;
+# only takes effect when the scan interval is shorter
+SECTION_TTLS = {
+    # Statement digest and table/file I/O aggregates over performance_schema
+    "performance_data": 300,
+}
+
+# Cache lifetime (seconds) for server settings the client looks up on its own
+METADATA_TTL = 3600
+
+# Server-side limits (milliseconds) for polling SELECTs and for the
+# information_schema scans, sent as MAX_EXECUTION_TIME hints
+QUERY_TIMEOUT_MS = 2000
+HEAVY_QUERY_TIMEOUT_MS = 30000
+
+# Client socket timeouts (seconds); reads outlast the heavy query limit
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 60
+
+# Pooled connections are recycled after this age (seconds) and pinged
+# before reuse once they have been idle longer than the idle threshold
+POOL_MAX_LIFETIME = 300
+POOL_PING_IDLE = 30
 
 # Configuration keys
 CONF_USE_SSL = "use_ssl"
@@ -13,8 +42,12 @@ CONF_SSL_VERIFY = "ssl_verify"
 CONF_INCLUDE_DBS = "include_dbs"
 CONF_EXCLUDE_DBS = "exclude_dbs"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_HEAVY_SCAN_INTERVAL = "heavy_scan_interval"
 CONF_ENABLE_QUERY_CACHE = "enable_query_cache"
 CONF_ENABLE_REPLICATION = "enable_replication"
+CONF_ENABLE_BUFFER_POOL_DETAIL = "enable_buffer_pool_detail"
+CONF_DB_MIN_SIZE_BYTES = "db_min_size_bytes"
+CONF_LEGACY_SPLIT_DB_SENSORS = "legacy_split_db_sensors"
 
 # System databases to exclude
 SYSTEM_DATABASES = [
@@ -23,16 +56,18 @@ SYSTEM_DATABASES = [
     "performance_schema",
     "sys",
 ]
+SYSTEM_DATABASE_SET = frozenset(SYSTEM_DATABASES)
 
-# Connection error metrics to aggregate
-CONNECTION_ERROR_METRICS = [
+# Connection error metrics to aggregate; metric groups are only iterated
+# in order, so they are tuples rather than sets
+CONNECTION_ERROR_METRICS = (
     "Connection_errors_accept",
     "Connection_errors_internal",
     "Connection_errors_max_connections",
     "Connection_errors_peer_address",
     "Connection_errors_select",
     "Connection_errors_tcpwrap",
-]
+)
 
 # Metric categories
 METRIC_CATEGORIES = {
@@ -84,7 +119,7 @@ METRIC_CATEGORIES = {
 }
 
 # Query cache metrics (conditional)
-QUERY_CACHE_METRICS = [
+QUERY_CACHE_METRICS = (
     "Qcache_hits",
     "Qcache_inserts",
     "Qcache_lowmem_prunes",
@@ -93,10 +128,10 @@ QUERY_CACHE_METRICS = [
     "Qcache_total_blocks",
     "Qcache_free_blocks",
     "Qcache_free_memory",
-]
+)
 
 # Replication metrics (conditional)
-REPLICATION_METRICS = [
+REPLICATION_METRICS = (
     "Rpl_semi_sync_master_clients",
     "Rpl_semi_sync_master_net_waits",
     "Rpl_semi_sync_master_no_tx",
@@ -107,20 +142,20 @@ REPLICATION_METRICS = [
     "Rpl_semi_sync_master_wait_pos_backtraverse",
     "Rpl_semi_sync_master_wait_sessions",
     "Rpl_semi_sync_master_yes_tx",
-]
+)
 
-# Units for metrics
+# Units for metrics (frozensets: constant, and used for membership tests)
 METRIC_UNITS = {
-    "bytes": [
+    "bytes": frozenset({
         "Bytes_received",
         "Bytes_sent",
         "Innodb_data_read",
         "Innodb_data_written",
         "Innodb_os_log_written",
         "Qcache_free_memory",
-    ],
-    "milliseconds": [],
-    "percentage": [],
+    }),
+    "milliseconds": frozenset(),
+    "percentage": frozenset(),
 }
 
 # Sensor icons
@@ -154,3 +189,10 @@ RESOURCE_THRESHOLDS = {
     "connections_warning": 80,
     "connections_critical": 95,
 }
+
+# Metric -> unit lookup precomputed from METRIC_UNITS
+METRIC_TO_UNIT = {
+    metric: unit
+    for unit, metrics in METRIC_UNITS.items()
+    for metric in metrics
+}
@@ -1,16 +1,278 @@
 """MySQL client for the integration."""
+import heapq
 import logging
+import queue
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import pymysql
 import psutil
+from pymysql.constants import CLIENT, FIELD_TYPE
+from pymysql.converters import conversions, escape_string
 
-from .const import SYSTEM_DATABASES
+from .const import (
+    CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    HEAVY_QUERY_TIMEOUT_MS,
+    METADATA_TTL,
+    POOL_MAX_LIFETIME,
+    POOL_PING_IDLE,
+    QUERY_TIMEOUT_MS,
+    READ_TIMEOUT,
+    SYSTEM_DATABASE_SET,
+    SYSTEM_DATABASES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Decode DECIMAL columns (e.g. SUM() results) straight to float so the
+# payload is JSON serializable without a Decimal conversion pass
+MYSQL_CONVERSIONS = conversions.copy()
+MYSQL_CONVERSIONS[FIELD_TYPE.DECIMAL] = float
+MYSQL_CONVERSIONS[FIELD_TYPE.NEWDECIMAL] = float
+
+# Counters parsed from SHOW ENGINE INNODB STATUS: (key, text prefix, cast)
+_INNODB_PATTERNS = [
+    ("history_list_length", r"History list length ", int),
+    ("pending_log_flushes", r"Pending flushes \(fsync\) log: ", int),
+    ("log_sequence_number", r"Log sequence number\s+", int),
+    ("log_flushed_up_to", r"Log flushed up to\s+", int),
+    ("last_checkpoint_at", r"Last checkpoint at\s+", int),
+    ("pending_aio_reads", r"Pending normal aio reads: ", int),
+    ("pending_aio_writes", r"Pending normal aio writes: ", int),
+    ("mutex_spin_waits", r"Mutex spin waits ", int),
+    ("mutex_spin_rounds", r"Mutex spin rounds ", int),
+    ("transaction_id_counter", r"Trx id counter ", int),
+]
+# One alternation with a named group per counter plus the deadlock
+# section marker, so the status text is scanned exactly once
+_INNODB_COMBINED = re.compile(
+    "|".join(
+        [rf"{prefix}(?P<{key}>\d+)" for key, prefix, _ in _INNODB_PATTERNS]
+        + [r"(?P<has_recent_deadlock>LATEST DETECTED DEADLOCK)"]
+    )
+)
+_INNODB_CASTS = {key: cast for key, _, cast in _INNODB_PATTERNS}
+_INNODB_CASTS["has_recent_deadlock"] = bool
+
+# Rows pulled per read from unbuffered (server-side) cursors
+_STREAM_CHUNK = 256
+
+
+class _StreamCursor(pymysql.cursors.SSCursor):
+    """Unbuffered tuple cursor whose fetchmany() reads a chunk of rows."""
+    
+    arraysize = _STREAM_CHUNK
+
+
+class _StreamDictCursor(pymysql.cursors.SSDictCursor):
+    """Unbuffered dict cursor whose fetchmany() reads a chunk of rows."""
+    
+    arraysize = _STREAM_CHUNK
+
+
+# KILL QUERY (ER_QUERY_INTERRUPTED) and MAX_EXECUTION_TIME expiry
+# (ER_QUERY_TIMEOUT); collectors treat these as an empty result
+_QUERY_TIMEOUT_ERRORS = frozenset({1317, 3024})
+
+
+# Login-time refusals (too many connections, access denied) that mean the
+# server cannot be used at all, unlike a denied query on one section
+_CONNECTION_ERROR_CODES = frozenset({1040, 1044, 1045})
+
+
+def is_connection_error(err: Exception) -> bool:
+    """Return True if an error means the server is unreachable.
+    
+    Client-side CR_* errors (2000-2999: cannot connect, server gone away,
+    lost connection) and login refusals qualify; they propagate out of
+    the collectors so the coordinator can fail the refresh.
+    """
+    if isinstance(err, pymysql.err.InterfaceError):
+        return True
+    if not isinstance(err, pymysql.err.OperationalError) or not err.args:
+        return False
+    code = err.args[0]
+    return 2000 <= code < 3000 or code in _CONNECTION_ERROR_CODES
+
+
+def _is_query_timeout(err: Exception) -> bool:
+    """Return True if a query was cut short by the server."""
+    return (
+        isinstance(err, pymysql.err.OperationalError)
+        and bool(err.args)
+        and err.args[0] in _QUERY_TIMEOUT_ERRORS
+    )
+
+
+def _cpu_total_idle(times) -> Tuple[float, float]:
+    """Return (total, idle) seconds from a psutil.cpu_times() sample."""
+    total = sum(times)
+    # Linux counts guest time inside user/nice as well
+    total -= getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+    idle = times.idle + getattr(times, "iowait", 0.0)
+    return total, idle
+
+
+# Per-database size columns, in the order get_database_sizes selects them
+_DB_SIZE_FIELDS = (
+    "table_count",
+    "total_rows",
+    "data_size",
+    "index_size",
+    "total_size",
+    "free_size",
+)
+
+
+class BufferPoolInstance(NamedTuple):
+    """One INNODB_BUFFER_POOL_STATS row, in the order it is selected."""
+    
+    pool_id: int
+    pool_size: int
+    free_buffers: int
+    database_pages: int
+    modified_database_pages: int
+    hit_rate: int
+    pages_read_rate: float
+    pages_written_rate: float
+
+
+# Global counters and settings the lock and transaction collectors report
+_LOCK_STATUS_VARS = (
+    "Innodb_row_lock_waits",
+    "Innodb_row_lock_time",
+    "Innodb_row_lock_time_avg",
+    "Innodb_row_lock_time_max",
+    "Table_locks_waited",
+)
+_TRX_STATUS_VARS = (
+    "Com_commit",
+    "Com_rollback",
+    "Com_rollback_to_savepoint",
+    "Com_savepoint",
+)
+_SLOW_QUERY_VARS = (
+    "slow_query_log",
+    "slow_query_log_file",
+    "long_query_time",
+    "log_queries_not_using_indexes",
+)
+# transaction_isolation (5.7.20+) replaced tx_isolation (removed in 8.0)
+_TRX_ISOLATION_VARS = ("transaction_isolation", "tx_isolation")
+
+
+class SystemResources(NamedTuple):
+    """Host resource usage sampled by get_system_resources."""
+    
+    cpu_percent: Optional[float] = None
+    cpu_count: Optional[int] = None
+    memory_total: Optional[int] = None
+    memory_used: Optional[int] = None
+    memory_available: Optional[int] = None
+    memory_percent: Optional[float] = None
+    datadir_total: Optional[int] = None
+    datadir_used: Optional[int] = None
+    datadir_free: Optional[int] = None
+    datadir_percent: Optional[float] = None
+
+
+# Current lock waits, keyed by the source probed on the server:
+# sys schema view, MySQL 5.7 information_schema, or 8.0 performance_schema
+_LOCK_WAIT_QUERIES = {
+    "sys": f"""
+        SELECT /*+ MAX_EXECUTION_TIME({QUERY_TIMEOUT_MS}) */
+            waiting_trx_id,
+            waiting_pid,
+            waiting_query,
+            blocking_trx_id,
+            blocking_pid,
+            blocking_query,
+            wait_started,
+            wait_age_secs,
+            locked_table,
+            locked_index
+        FROM sys.innodb_lock_waits
+        LIMIT 10
+    """,
+    "is": f"""
+        SELECT /*+ MAX_EXECUTION_TIME({QUERY_TIMEOUT_MS}) */
+            r.trx_id AS waiting_trx_id,
+            r.trx_mysql_thread_id AS waiting_pid,
+            r.trx_query AS waiting_query,
+            b.trx_id AS blocking_trx_id,
+            b.trx_mysql_thread_id AS blocking_pid,
+            b.trx_query AS blocking_query,
+            r.trx_wait_started AS wait_started
+        FROM information_schema.innodb_lock_waits w
+        JOIN information_schema.innodb_trx r ON w.requesting_trx_id = r.trx_id
+        JOIN information_schema.innodb_trx b ON w.blocking_trx_id = b.trx_id
+        LIMIT 10
+    """,
+    "ps": f"""
+        SELECT /*+ MAX_EXECUTION_TIME({QUERY_TIMEOUT_MS}) */
+            r.trx_id AS waiting_trx_id,
+            r.trx_mysql_thread_id AS waiting_pid,
+            r.trx_query AS waiting_query,
+            b.trx_id AS blocking_trx_id,
+            b.trx_mysql_thread_id AS blocking_pid,
+            b.trx_query AS blocking_query,
+            r.trx_wait_started AS wait_started
+        FROM performance_schema.data_lock_waits w
+        JOIN information_schema.innodb_trx r
+            ON w.REQUESTING_ENGINE_TRANSACTION_ID = r.trx_id
+        JOIN information_schema.innodb_trx b
+            ON w.BLOCKING_ENGINE_TRANSACTION_ID = b.trx_id
+        LIMIT 10
+    """,
+}
+
+# Active transactions, keyed by the probed source. performance_schema
+# reads instrumented data without taking InnoDB's transaction list lock;
+# INNODB_TRX is the fallback when the transaction consumer is off.
+# Both report the transaction age in whole seconds as age_secs.
+_TRANSACTION_QUERIES = {
+    "ps": f"""
+        SELECT /*+ MAX_EXECUTION_TIME({QUERY_TIMEOUT_MS}) */
+            e.TRX_ID as trx_id,
+            e.STATE as trx_state,
+            NOW(6) - INTERVAL (e.TIMER_WAIT DIV 1000000) MICROSECOND as trx_started,
+            e.ISOLATION_LEVEL as trx_isolation_level,
+            e.AUTOCOMMIT as trx_autocommit,
+            th.PROCESSLIST_ID as trx_mysql_thread_id,
+            th.PROCESSLIST_INFO as trx_query,
+            e.TIMER_WAIT DIV 1000000000000 as age_secs
+        FROM performance_schema.events_transactions_current e
+        JOIN performance_schema.threads th ON th.THREAD_ID = e.THREAD_ID
+        WHERE e.STATE = 'ACTIVE'
+            AND th.PROCESSLIST_ID <> CONNECTION_ID()
+        ORDER BY e.TIMER_WAIT DESC
+    """,
+    "is": f"""
+        SELECT /*+ MAX_EXECUTION_TIME({QUERY_TIMEOUT_MS}) */
+            trx_id,
+            trx_state,
+            trx_started,
+            trx_requested_lock_id,
+            trx_wait_started,
+            trx_weight,
+            trx_mysql_thread_id,
+            trx_query,
+            trx_operation_state,
+            trx_tables_in_use,
+            trx_tables_locked,
+            trx_rows_locked,
+            trx_rows_modified,
+            TIMESTAMPDIFF(SECOND, trx_started, NOW()) as age_secs
+        FROM information_schema.INNODB_TRX
+        ORDER BY trx_started
+    """,
+}
+
 
 class MySQLClient:
     """MySQL client wrapper."""
@@ -24,6 +286,7 @@ class MySQLClient:
         use_ssl: bool = False,
         ssl_ca: Optional[str] = None,
         ssl_verify: bool = True,
+        pool_size: int = DEFAULT_POOL_SIZE,
     ) -> None:
         """Initialize MySQL client."""
         self.host = host
@@ -33,97 +296,416 @@ class MySQLClient:
         self.use_ssl = use_ssl
         self.ssl_ca = ssl_ca
         self.ssl_verify = ssl_verify
-        self._connection = None
-    
-    def _get_connection(self):
-        """Get MySQL connection."""
-        if self._connection is None or not self._connection.open:
-            ssl_config = None
-            if self.use_ssl:
-                ssl_config = {
-                    "ca": self.ssl_ca,
-                    "check_hostname": self.ssl_verify,
-                    "verify_mode": self.ssl_verify,
-                }
+        
+        # Idle connections are reused most-recently-first as
+        # (connection, created, last_used) entries; the semaphore caps how
+        # many connections are open at the same time.
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._pool_slots = threading.BoundedSemaphore(pool_size)
+        
+        # Server settings that rarely change: key -> (loaded_at, value)
+        self._meta_cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # CPU times at the previous poll; kept per client because
+        # psutil.cpu_percent(interval=None) shares one process-wide baseline
+        self._cpu_times = psutil.cpu_times()
+        
+        # Server-side prepared statements per connection:
+        # thread_id -> {statement name: prepared SQL text}
+        self._prepared: Dict[int, Dict[str, str]] = {}
+        
+        # Reusable buffered cursors per connection: thread_id -> {class: cursor}
+        self._cursors: Dict[int, Dict[type, Any]] = {}
+        
+        # Resolved schema filters: (include, exclude, column) -> WHERE SQL
+        self._filter_cache: Dict[Tuple[Any, ...], str] = {}
+        
+        # SHOW GLOBAL STATUS / VARIABLES taken once per refresh; collectors
+        # read from these instead of querying the server themselves
+        self._status_snapshot: Dict[str, Any] = {}
+        self._vars_snapshot: Dict[str, Any] = {}
+    
+    def _create_connection(self):
+        """Open a new MySQL connection."""
+        ssl_config = None
+        if self.use_ssl:
+            ssl_config = {
+                "ca": self.ssl_ca,
+                "check_hostname": self.ssl_verify,
+                "verify_mode": self.ssl_verify,
+            }
+        
+        # Protocol compression is not available: PyMySQL rejects
+        # compress=True (NotImplementedError) and cannot speak zlib/zstd.
+        # Likewise CLIENT_OPTIONAL_RESULTSET_METADATA is not understood by
+        # its result parser, so column metadata is always sent.
+        # Every statement runs in its own autocommit transaction; READ
+        # COMMITTED keeps those from building a consistent-read snapshot,
+        # so the monitor never holds back purge between polls.
+        conn = pymysql.connect(
+            host=self.host,
+            port=self.port,
+            user=self.username,
+            password=self.password,
+            charset="utf8mb4",
+            cursorclass=pymysql.cursors.DictCursor,
+            conv=MYSQL_CONVERSIONS,
+            ssl=ssl_config,
+            autocommit=True,
+            connect_timeout=CONNECT_TIMEOUT,
+            read_timeout=READ_TIMEOUT,
+            init_command="SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED",
+            client_flag=CLIENT.MULTI_STATEMENTS,
+        )
+        
+        # Keep idle pooled sockets alive through NAT/firewall timeouts
+        try:
+            conn._sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (AttributeError, OSError) as err:
+            _LOGGER.debug("Could not enable TCP keepalive: %s", err)
+        
+        return conn
+    
+    def _close_connection(self, conn) -> None:
+        """Close a connection, ignoring errors from already broken sockets."""
+        self._prepared.pop(conn.thread_id(), None)
+        self._cursors.pop(conn.thread_id(), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+    
+    @contextmanager
+    def _borrow(self) -> Iterator[Any]:
+        """Borrow a connection from the pool for the duration of a block."""
+        with self._pool_slots:
+            try:
+                conn, created, last_used = self._pool.get_nowait()
+            except queue.Empty:
+                conn = None
             
-            self._connection = pymysql.connect(
-                host=self.host,
-                port=self.port,
-                user=self.username,
-                password=self.password,
-                charset="utf8mb4",
-                cursorclass=pymysql.cursors.DictCursor,
-                ssl=ssl_config,
-                autocommit=True,
-            )
+            now = time.monotonic()
+            if conn is not None:
+                if not conn.open or now - created > POOL_MAX_LIFETIME:
+                    self._close_connection(conn)
+                    conn = None
+                elif now - last_used > POOL_PING_IDLE:
+                    # Server may have dropped an idle connection (wait_timeout)
+                    try:
+                        conn.ping(reconnect=False)
+                    except pymysql.Error:
+                        self._close_connection(conn)
+                        conn = None
+            
+            if conn is None:
+                conn = self._create_connection()
+                created = now
+            
+            try:
+                yield conn
+            finally:
+                # Broken connections are dropped and replaced on next borrow
+                if conn.open:
+                    self._pool.put_nowait((conn, created, time.monotonic()))
+                else:
+                    self._prepared.pop(conn.thread_id(), None)
+                    self._cursors.pop(conn.thread_id(), None)
+    
+    @contextmanager
+    def _cursor(self, cursor_class=None) -> Iterator[Tuple[Any, Any]]:
+        """Borrow a connection together with a cursor.
+        
+        Buffered cursors are kept per connection and reused, with any
+        pending result sets drained after each block. Unbuffered cursors
+        are opened per block, since closing them discards unread rows.
+        """
+        cursor_class = cursor_class or pymysql.cursors.DictCursor
+        with self._borrow() as conn:
+            if issubclass(cursor_class, pymysql.cursors.SSCursor):
+                with conn.cursor(cursor_class) as cursor:
+                    yield conn, cursor
+                return
+            
+            cursors = self._cursors.setdefault(conn.thread_id(), {})
+            cursor = cursors.get(cursor_class)
+            if cursor is None:
+                cursor = cursors[cursor_class] = conn.cursor(cursor_class)
+            try:
+                yield conn, cursor
+            finally:
+                if conn.open:
+                    try:
+                        while cursor.nextset():
+                            pass
+                    except pymysql.Error:
+                        # Unknown protocol state; drop it rather than reuse
+                        self._close_connection(conn)
+    
+    def _sample_cpu_percent(self) -> float:
+        """Return host CPU usage since this client's previous sample."""
+        times = psutil.cpu_times()
+        previous, self._cpu_times = self._cpu_times, times
+        
+        total, idle = _cpu_total_idle(times)
+        prev_total, prev_idle = _cpu_total_idle(previous)
+        total_delta = total - prev_total
+        if total_delta <= 0:
+            return 0.0
+        busy_delta = total_delta - (idle - prev_idle)
+        return round(min(max(busy_delta / total_delta * 100, 0.0), 100.0), 1)
+    
+    def _cached(self, key: str, ttl: float, loader) -> Any:
+        """Return a cached value, calling loader once the TTL has expired."""
+        now = time.monotonic()
+        entry = self._meta_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        
+        value = loader()
+        self._meta_cache[key] = (now, value)
+        return value
+    
+    def _fetch_digests_available(self) -> bool:
+        """Check that statement digests are being collected."""
+        try:
+            with self._cursor() as (conn, cursor):
+                cursor.execute("""
+                    SELECT 
+                        @@performance_schema = 1 AND EXISTS (
+                            SELECT 1
+                            FROM performance_schema.setup_consumers
+                            WHERE NAME = 'statements_digest' AND ENABLED = 'YES'
+                        ) as available
+                """)
+                result = cursor.fetchone()
+                return bool(result and result["available"])
+        except pymysql.Error as err:
+            _LOGGER.debug("Could not probe statement digests: %s", err)
+            return False
+    
+    def _fetch_processlist_source(self) -> str:
+        """Pick the cheapest available processlist table.
         
-        return self._connection
+        performance_schema.processlist (MySQL 8.0.22+) does not take the
+        global thread lock that INFORMATION_SCHEMA.PROCESSLIST holds.
+        """
+        try:
+            with self._cursor() as (conn, cursor):
+                cursor.execute("""
+                    SELECT 
+                        @@performance_schema = 1 AND EXISTS (
+                            SELECT 1
+                            FROM information_schema.tables
+                            WHERE table_schema = 'performance_schema'
+                                AND table_name = 'processlist'
+                        ) as available
+                """)
+                result = cursor.fetchone()
+                if result and result["available"]:
+                    return "performance_schema.processlist"
+        except pymysql.Error as err:
+            _LOGGER.debug("Could not probe performance_schema.processlist: %s", err)
+        return "INFORMATION_SCHEMA.PROCESSLIST"
+    
+    def _fetch_lock_waits_source(self) -> Optional[str]:
+        """Detect which lock wait view this server provides."""
+        with self._cursor() as (conn, cursor):
+            cursor.execute("""
+                SELECT 
+                    SUM(table_schema = 'sys') as has_sys,
+                    SUM(table_schema = 'performance_schema') as has_ps,
+                    SUM(table_schema = 'information_schema') as has_is
+                FROM information_schema.tables
+                WHERE (table_schema = 'sys' AND table_name = 'innodb_lock_waits')
+                    OR (table_schema = 'performance_schema' AND table_name = 'data_lock_waits')
+                    OR (table_schema = 'information_schema'
+                        AND UPPER(table_name) = 'INNODB_LOCK_WAITS')
+            """)
+            result = cursor.fetchone() or {}
+        
+        for source in ("sys", "ps", "is"):
+            if result.get(f"has_{source}"):
+                return source
+        return None
+    
+    def _fetch_transactions_source(self) -> str:
+        """Pick performance_schema transactions when they are instrumented."""
+        try:
+            with self._cursor() as (conn, cursor):
+                cursor.execute("""
+                    SELECT 
+                        @@performance_schema = 1 AND EXISTS (
+                            SELECT 1
+                            FROM performance_schema.setup_consumers
+                            WHERE NAME = 'events_transactions_current'
+                                AND ENABLED = 'YES'
+                        ) AND EXISTS (
+                            SELECT 1
+                            FROM performance_schema.setup_instruments
+                            WHERE NAME = 'transaction' AND ENABLED = 'YES'
+                        ) as available
+                """)
+                result = cursor.fetchone()
+                if result and result["available"]:
+                    return "ps"
+        except pymysql.Error as err:
+            _LOGGER.debug("Could not probe performance_schema transactions: %s", err)
+        return "is"
+    
+    def _processlist_source(self) -> str:
+        """Return the processlist table to query, probed once per TTL."""
+        return self._cached(
+            "processlist_source", METADATA_TTL, self._fetch_processlist_source
+        )
     
     def test_connection(self) -> bool:
         """Test MySQL connection."""
         try:
-            conn = self._get_connection()
-            with conn.cursor() as cursor:
-                cursor.execute("SELECT 1")
+            # COM_PING: no cursor and no result set to parse
+            with self._borrow() as conn:
+                conn.ping(reconnect=False)
                 return True
         except Exception as err:
             _LOGGER.error("Failed to connect to MySQL: %s", err)
             raise
     
     def close(self):
-        """Close MySQL connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close all pooled MySQL connections."""
+        while True:
+            try:
+                conn, _, _ = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._close_connection(conn)
+    
+    def fetch_batch(
+        self, queries: List[Any], cursor_class=None
+    ) -> List[List[Any]]:
+        """Run independent statements in one round-trip and return each result set.
+        
+        Entries are plain SQL or (name, sql) pairs for prepared statements.
+        Rows are dicts unless a tuple cursor_class is given.
+        """
+        with self._cursor(cursor_class) as (conn, cursor):
+            cursor.execute(self._batch_sql(conn, cursor, queries))
+            results = [cursor.fetchall()]
+            while cursor.nextset():
+                results.append(cursor.fetchall())
+            return results
+    
+    def _execute_prepared(
+        self, conn, cursor, name: str, sql: str, params: Optional[Any] = None
+    ) -> None:
+        """Execute a recurring query through a named server-side prepared statement.
+        
+        Parameters are inlined before preparing, so the statement text is
+        fixed for a given filter and is only re-prepared when it changes.
+        """
+        if params is not None:
+            sql = cursor.mogrify(sql, params)
+        
+        self._prepare(conn, cursor, name, sql)
+        cursor.execute(f"EXECUTE {name}")
+    
+    def _prepare(self, conn, cursor, name: str, sql: str) -> None:
+        """Prepare a named statement unless this connection already has it."""
+        prepared = self._prepared.setdefault(conn.thread_id(), {})
+        if prepared.get(name) != sql:
+            cursor.execute(f"PREPARE {name} FROM %s", (sql,))
+            prepared[name] = sql
+    
+    def _batch_sql(self, conn, cursor, queries: List[Any]) -> str:
+        """Join a batch into one multi-statement string.
+        
+        (name, sql) entries are prepared on first use and sent as EXECUTE,
+        so only the plain statements are parsed again on every poll.
+        """
+        statements = []
+        for query in queries:
+            if isinstance(query, tuple):
+                name, sql = query
+                self._prepare(conn, cursor, name, sql)
+                statements.append(f"EXECUTE {name}")
+            else:
+                statements.append(query)
+        return ";".join(statements)
+    
+    def _stream_query(
+        self,
+        sql: str,
+        params: Optional[Any] = None,
+        name: Optional[str] = None,
+        cursor_class=_StreamDictCursor,
+    ) -> Iterator[Any]:
+        """Yield rows from an unbuffered server-side cursor.
+        
+        With a name, the query runs as a server-side prepared statement.
+        Pass _StreamCursor as cursor_class to get plain tuples.
+        """
+        with self._cursor(cursor_class) as (conn, cursor):
+            if name:
+                self._execute_prepared(conn, cursor, name, sql, params)
+            else:
+                cursor.execute(sql, params)
+            # fetchmany() returns an empty tuple, not a list, at EOF
+            while chunk := cursor.fetchmany():
+                yield from chunk
+    
+    @staticmethod
+    def _read_variables(cursor) -> Dict[str, Any]:
+        """Build a name -> value dict from a SHOW STATUS/VARIABLES result.
+        
+        Expects a tuple cursor, so (name, value) rows feed dict.update
+        directly without a per-row dict.
+        """
+        result: Dict[str, Any] = {}
+        while chunk := cursor.fetchmany():
+            result.update(chunk)
+        return result
+    
+    def refresh_snapshots(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Fetch global status and variables in one round-trip for this refresh."""
+        try:
+            # Streamed so the ~1000 rows go straight into the dicts
+            with self._cursor(_StreamCursor) as (conn, cursor):
+                cursor.execute("SHOW GLOBAL STATUS;SHOW GLOBAL VARIABLES")
+                status = self._read_variables(cursor)
+                cursor.nextset()
+                variables = self._read_variables(cursor)
+        except Exception:
+            # Don't let collectors read the previous refresh's values
+            self._status_snapshot = {}
+            self._vars_snapshot = {}
+            raise
+        
+        self._status_snapshot = status
+        self._vars_snapshot = variables
+        return status, variables
+    
+    def _global_values(self, kind: str, names: Tuple[str, ...]) -> Dict[str, Any]:
+        """Pick global STATUS or VARIABLES values from this refresh's snapshot."""
+        snapshot = self._status_snapshot if kind == "STATUS" else self._vars_snapshot
+        return {name: snapshot[name] for name in names if name in snapshot}
     
     def get_server_info(self) -> Dict[str, Any]:
         """Get MySQL server information."""
-        conn = self._get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("SELECT VERSION() as version")
-            version = cursor.fetchone()["version"]
-            
-            cursor.execute("SELECT @@hostname as hostname")
-            hostname = cursor.fetchone()["hostname"]
-            
-            cursor.execute("SHOW VARIABLES LIKE 'datadir'")
-            datadir_result = cursor.fetchone()
-            datadir = datadir_result["Value"] if datadir_result else None
-            
+        with self._cursor() as (conn, cursor):
             cursor.execute("SELECT NOW() as server_time")
             server_time = cursor.fetchone()["server_time"]
-            
-            cursor.execute("SHOW STATUS LIKE 'Uptime'")
-            uptime_result = cursor.fetchone()
-            uptime = int(uptime_result["Value"]) if uptime_result else 0
-            
-            return {
-                "version": version,
-                "hostname": hostname,
-                "datadir": datadir,
-                "current_time": server_time,
-                "uptime": uptime,
-            }
-    
-    def get_global_status(self) -> Dict[str, Any]:
-        """Get MySQL global status."""
-        conn = self._get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("SHOW GLOBAL STATUS")
-            return {row["Variable_name"]: row["Value"] for row in cursor.fetchall()}
-    
-    def get_global_variables(self) -> Dict[str, Any]:
-        """Get MySQL global variables."""
-        conn = self._get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("SHOW GLOBAL VARIABLES")
-            return {row["Variable_name"]: row["Value"] for row in cursor.fetchall()}
+        
+        variables = self._vars_snapshot
+        return {
+            "version": variables.get("version"),
+            "hostname": variables.get("hostname"),
+            "datadir": variables.get("datadir"),
+            "current_time": server_time,
+            "uptime": int(self._status_snapshot.get("Uptime", 0)),
+        }
     
     def get_innodb_status(self) -> Dict[str, Any]:
         """Get and parse InnoDB engine status."""
-        conn = self._get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self._cursor() as (conn, cursor):
                 cursor.execute("SHOW ENGINE INNODB STATUS")
                 result = cursor.fetchone()
                 if not result or "Status" not in result:
@@ -133,80 +715,37 @@ class MySQLClient:
                 
                 # Parse InnoDB status
                 parsed = {}
+                for match in _INNODB_COMBINED.finditer(status_text):
+                    key = match.lastgroup
+                    # Keep the first occurrence, as a per-pattern search would
+                    if key not in parsed:
+                        parsed[key] = _INNODB_CASTS[key](match.group(key))
                 
-                # History list length
-                match = re.search(r"History list length (\d+)", status_text)
-                if match:
-                    parsed["history_list_length"] = int(match.group(1))
-                
-                # Pending reads/writes
-                match = re.search(r"Pending flushes \(fsync\) log: (\d+)", status_text)
-                if match:
-                    parsed["pending_log_flushes"] = int(match.group(1))
-                
-                # Checkpoint info
-                match = re.search(r"Log sequence number\s+(\d+)", status_text)
-                if match:
-                    parsed["log_sequence_number"] = int(match.group(1))
-                
-                match = re.search(r"Log flushed up to\s+(\d+)", status_text)
-                if match:
-                    parsed["log_flushed_up_to"] = int(match.group(1))
-                
-                match = re.search(r"Last checkpoint at\s+(\d+)", status_text)
-                if match:
-                    parsed["last_checkpoint_at"] = int(match.group(1))
-                
-                # Pending I/O
-                match = re.search(r"Pending normal aio reads: (\d+)", status_text)
-                if match:
-                    parsed["pending_aio_reads"] = int(match.group(1))
-                
-                match = re.search(r"Pending normal aio writes: (\d+)", status_text)
-                if match:
-                    parsed["pending_aio_writes"] = int(match.group(1))
-                
-                # Mutex info
-                match = re.search(r"Mutex spin waits (\d+)", status_text)
-                if match:
-                    parsed["mutex_spin_waits"] = int(match.group(1))
-                
-                match = re.search(r"Mutex spin rounds (\d+)", status_text)
-                if match:
-                    parsed["mutex_spin_rounds"] = int(match.group(1))
-                
-                # Transaction info
-                match = re.search(r"Trx id counter (\d+)", status_text)
-                if match:
-                    parsed["transaction_id_counter"] = int(match.group(1))
-                
-                # Deadlocks
-                match = re.search(r"LATEST DETECTED DEADLOCK", status_text)
-                parsed["has_recent_deadlock"] = bool(match)
+                # Deadlock marker is matched by the same scan
+                parsed.setdefault("has_recent_deadlock", False)
                 
                 return parsed
         except Exception as err:
+            if is_connection_error(err):
+                raise
             _LOGGER.warning("Failed to get InnoDB status: %s", err)
             return {}
     
     def get_performance_data(self) -> Dict[str, Any]:
         """Get performance schema data if available."""
-        conn = self._get_connection()
         data = {}
         
         try:
-            with conn.cursor() as cursor:
+            with self._cursor() as (conn, cursor):
                 # Check if performance_schema is enabled
-                cursor.execute("SHOW VARIABLES LIKE 'performance_schema'")
-                result = cursor.fetchone()
-                if not result or result["Value"] != "ON":
+                if self._vars_snapshot.get("performance_schema") != "ON":
                     return {"enabled": False}
                 
                 data["enabled"] = True
                 
                 # Statement summary
                 try:
-                    cursor.execute("""
+                    self._execute_prepared(conn, cursor, "mm_top_statements", """
                         SELECT 
                             DIGEST_TEXT,
                             COUNT_STAR,
@@ -226,7 +765,7 @@ class MySQLClient:
                 
                 # Table I/O summary
                 try:
-                    cursor.execute("""
+                    self._execute_prepared(conn, cursor, "mm_table_io", """
                         SELECT 
                             OBJECT_SCHEMA,
                             OBJECT_NAME,
@@ -250,7 +789,7 @@ class MySQLClient:
                 
                 # File I/O summary
                 try:
-                    cursor.execute("""
+                    self._execute_prepared(conn, cursor, "mm_file_io", """
                         SELECT 
                             FILE_NAME,
                             COUNT_STAR,
@@ -270,7 +809,7 @@ class MySQLClient:
                 
                 # User summary
                 try:
-                    cursor.execute("""
+                    self._execute_prepared(conn, cursor, "mm_user_summary", """
                         SELECT 
                             USER,
                             CURRENT_CONNECTIONS,
@@ -283,6 +822,8 @@ class MySQLClient:
                     data["user_summary"] = []
                 
         except Exception as err:
+            if is_connection_error(err):
+                raise
             _LOGGER.warning("Failed to get performance schema data: %s", err)
             data["enabled"] = False
             data["error"] = str(err)
@@ -291,10 +832,10 @@ class MySQLClient:
     
     def get_process_list(self) -> List[Dict[str, Any]]:
         """Get current process list."""
-        conn = self._get_connection()
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
+            source = self._processlist_source()
+            with self._cursor() as (conn, cursor):
+                cursor.execute(f"""
                     SELECT 
                         ID,
                         USER,
@@ -304,23 +845,24 @@ class MySQLClient:
                         TIME,
                         STATE,
                         INFO
-                    FROM INFORMATION_SCHEMA.PROCESSLIST
+                    FROM {source}
                     WHERE COMMAND != 'Sleep'
                     ORDER BY TIME DESC
                     LIMIT 20
                 """)
                 return cursor.fetchall()
         except Exception as err:
+            if is_connection_error(err):
+                raise
             _LOGGER.warning("Failed to get process list: %s", err)
             return []
     
     def get_replication_status(self) -> Dict[str, Any]:
         """Get replication status."""
-        conn = self._get_connection()
         data = {}
         
         try:
-            with conn.cursor() as cursor:
+            with self._cursor() as (conn, cursor):
                 # Master status
                 try:
                     cursor.execute("SHOW MASTER STATUS")
@@ -350,18 +892,22 @@ class MySQLClient:
                 except Exception:
                     pass
         except Exception as err:
+            if is_connection_error(err):
+                raise
             _LOGGER.debug("No replication configured: %s", err)
         
         return data
     
-    def get_system_resources(self) -> Dict[str, Any]:
+    def get_system_resources(self) -> SystemResources:
         """Get system resource usage of MySQL server."""
         data = {}
         
         try:
             # Get overall system stats
-            data["cpu_percent"] = psutil.cpu_percent(interval=1)
-            data["cpu_count"] = psutil.cpu_count()
+            # Non-blocking: measured against this client's previous sample
+            data["cpu_percent"] = self._sample_cpu_percent()
+            # Host topology does not change while we run
+            data["cpu_count"] = self._cached("cpu_count", METADATA_TTL, psutil.cpu_count)
             
             memory = psutil.virtual_memory()
             data["memory_total"] = memory.total
@@ -371,245 +917,234 @@ class MySQLClient:
             
             # Disk usage for data directory
             try:
-                conn = self._get_connection()
-                with conn.cursor() as cursor:
-                    cursor.execute("SHOW VARIABLES LIKE 'datadir'")
-                    result = cursor.fetchone()
-                    if result:
-                        datadir = result["Value"]
-                        disk_usage = psutil.disk_usage(datadir)
-                        data["datadir_total"] = disk_usage.total
-                        data["datadir_used"] = disk_usage.used
-                        data["datadir_free"] = disk_usage.free
-                        data["datadir_percent"] = disk_usage.percent
+                datadir = self._vars_snapshot.get("datadir")
+                if datadir:
+                    disk_usage = psutil.disk_usage(datadir)
+                    data["datadir_total"] = disk_usage.total
+                    data["datadir_used"] = disk_usage.used
+                    data["datadir_free"] = disk_usage.free
+                    data["datadir_percent"] = disk_usage.percent
             except Exception as err:
                 _LOGGER.debug("Could not get disk usage: %s", err)
         
         except Exception as err:
             _LOGGER.error("Failed to get system resources: %s", err)
         
-        return data
+        return SystemResources(**data)
+    
+    def _schema_filter(
+        self,
+        include_dbs: Iterable[str],
+        exclude_dbs: Iterable[str],
+        column: str = "table_schema",
+    ) -> str:
+        """Build the server-side schema filter for information_schema queries.
+        
+        An include list selects exactly those schemas; otherwise system
+        schemas and the exclude list are filtered out. The filter only
+        changes with the options, so the escaped SQL is built once per
+        combination and spliced into the query text.
+        """
+        key = (frozenset(include_dbs), frozenset(exclude_dbs), column)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        include, exclude, _ = key
+        if include:
+            operator, names = "IN", include
+        else:
+            operator, names = "NOT IN", SYSTEM_DATABASE_SET | exclude
+        literal = ", ".join(f"'{escape_string(name)}'" for name in sorted(names))
+        
+        cached = f"{column} {operator} ({literal})"
+        self._filter_cache[key] = cached
+        return cached
     
     def get_database_sizes(
         self, 
-        include_dbs: List[str], 
-        exclude_dbs: List[str]
+        include_dbs: Iterable[str], 
+        exclude_dbs: Iterable[str]
     ) -> Dict[str, Dict[str, Any]]:
         """Get database sizes and statistics."""
-        conn = self._get_connection()
-        with conn.cursor() as cursor:
-            # Build WHERE clause for database filtering
-            where_clauses = ["table_schema NOT IN %s"]
-            params = [SYSTEM_DATABASES]
-            
-            if include_dbs:
-                where_clauses = ["table_schema IN %s"]
-                params = [include_dbs]
-            elif exclude_dbs:
-                # Combine system DBs and excluded DBs
-                excluded = list(SYSTEM_DATABASES) + exclude_dbs
-                params = [excluded]
-            
-            where_clause = " AND ".join(where_clauses)
-            
-            cursor.execute(f"""
-                SELECT 
-                    table_schema as db_name,
-                    COUNT(DISTINCT table_name) as table_count,
-                    SUM(table_rows) as total_rows,
-                    SUM(data_length) as data_size,
-                    SUM(index_length) as index_size,
-                    SUM(data_length + index_length) as total_size,
-                    SUM(data_free) as free_size
-                FROM information_schema.tables
-                WHERE {where_clause}
-                GROUP BY table_schema
-            """, params)
-            
-            databases = {}
-            for row in cursor.fetchall():
-                databases[row["db_name"]] = {
-                    "table_count": row["table_count"] or 0,
-                    "total_rows": row["total_rows"] or 0,
-                    "data_size": row["data_size"] or 0,
-                    "index_size": row["index_size"] or 0,
-                    "total_size": row["total_size"] or 0,
-                    "free_size": row["free_size"] or 0,
-                }
-            
-            return databases
+        where_clause = self._schema_filter(include_dbs, exclude_dbs)
+        
+        # One tuple row per schema, consumed as it arrives
+        rows = self._stream_query(f"""
+            SELECT /*+ MAX_EXECUTION_TIME({HEAVY_QUERY_TIMEOUT_MS}) */
+                table_schema as db_name,
+                COUNT(DISTINCT table_name) as table_count,
+                SUM(table_rows) as total_rows,
+                SUM(data_length) as data_size,
+                SUM(index_length) as index_size,
+                SUM(data_length + index_length) as total_size,
+                SUM(data_free) as free_size
+            FROM information_schema.tables
+            WHERE {where_clause}
+            GROUP BY table_schema
+        """, name="mm_database_sizes", cursor_class=_StreamCursor)
+        
+        databases = {}
+        for db_name, *values in rows:
+            databases[db_name] = {
+                field: value or 0 for field, value in zip(_DB_SIZE_FIELDS, values)
+            }
+        
+        return databases
     
     def get_table_statistics(
         self,
-        include_dbs: List[str],
-        exclude_dbs: List[str],
+        include_dbs: Iterable[str],
+        exclude_dbs: Iterable[str],
         limit: int = 20
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Get table statistics."""
-        conn = self._get_connection()
-        data = {}
+        where_clause = self._schema_filter(
+            include_dbs, exclude_dbs, column="t.table_schema"
+        )
         
-        with conn.cursor() as cursor:
-            # Build WHERE clause
-            where_clauses = ["table_schema NOT IN %s"]
-            params = [SYSTEM_DATABASES]
-            
-            if include_dbs:
-                where_clauses = ["table_schema IN %s"]
-                params = [include_dbs]
-            elif exclude_dbs:
-                excluded = list(SYSTEM_DATABASES) + exclude_dbs
-                params = [excluded]
-            
-            where_clause = " AND ".join(where_clauses)
-            
-            try:
-                # Largest tables by size
-                cursor.execute(f"""
-                    SELECT 
-                        table_schema,
-                        table_name,
-                        table_rows,
-                        data_length,
-                        index_length,
-                        data_length + index_length as total_size,
-                        data_free
-                    FROM information_schema.tables
-                    WHERE {where_clause}
-                        AND table_type = 'BASE TABLE'
-                    ORDER BY (data_length + index_length) DESC
-                    LIMIT %s
-                """, params + [limit])
-                data["largest_tables"] = cursor.fetchall()
-            except Exception:
-                data["largest_tables"] = []
-            
-            try:
-                # Most fragmented tables
-                cursor.execute(f"""
-                    SELECT 
-                        table_schema,
-                        table_name,
-                        data_free,
-                        data_length + index_length as total_size,
-                        ROUND((data_free / (data_length + index_length + 1)) * 100, 2) as fragmentation_pct
-                    FROM information_schema.tables
-                    WHERE {where_clause} 
-                        AND data_free > 0 
-                        AND data_length + index_length > 0
-                        AND table_type = 'BASE TABLE'
-                    ORDER BY data_free DESC
-                    LIMIT %s
-                """, params + [limit])
-                data["fragmented_tables"] = cursor.fetchall()
-            except Exception:
-                data["fragmented_tables"] = []
-            
-            try:
-                # Tables without primary key
-                cursor.execute(f"""
-                    SELECT 
-                        t.table_schema,
-                        t.table_name,
-                        t.table_rows,
-                        t.data_length + t.index_length as total_size
-                    FROM information_schema.tables t
-                    WHERE {where_clause}
-                        AND NOT EXISTS (
-                            SELECT 1 
-                            FROM information_schema.statistics s
-                            WHERE s.table_schema = t.table_schema 
-                                AND s.table_name = t.table_name
-                                AND s.index_name = 'PRIMARY'
-                        )
-                        AND t.table_type = 'BASE TABLE'
-                    ORDER BY (t.data_length + t.index_length) DESC
-                    LIMIT %s
-                """, params + [limit])
-                data["tables_without_pk"] = cursor.fetchall()
-            except Exception:
-                data["tables_without_pk"] = []
+        # Bounded min-heaps of (sort_key, seq, row); seq breaks ties so rows
+        # are never compared
+        largest: List[Tuple[int, int, Dict[str, Any]]] = []
+        fragmented: List[Tuple[int, int, Dict[str, Any]]] = []
+        without_pk: List[Tuple[int, int, Dict[str, Any]]] = []
+        
+        def push(heap, key, seq, row):
+            if len(heap) < limit:
+                heapq.heappush(heap, (key, seq, row))
+            elif key > heap[0][0]:
+                heapq.heappushpop(heap, (key, seq, row))
+        
+        try:
+            # One scan of information_schema.tables feeds all three lists.
+            rows = self._stream_query(f"""
+                SELECT /*+ MAX_EXECUTION_TIME({HEAVY_QUERY_TIMEOUT_MS}) */
+                    t.table_schema as table_schema,
+                    t.table_name as table_name,
+                    t.table_rows as table_rows,
+                    t.data_length as data_length,
+                    t.index_length as index_length,
+                    t.data_free as data_free,
+                    p.table_name IS NOT NULL as has_pk
+                FROM information_schema.tables t
+                LEFT JOIN (
+                    SELECT DISTINCT table_schema, table_name
+                    FROM information_schema.statistics
+                    WHERE index_name = 'PRIMARY'
+                ) p ON p.table_schema = t.table_schema
+                    AND p.table_name = t.table_name
+                WHERE {where_clause}
+                    AND t.table_type = 'BASE TABLE'
+            """, name="mm_table_stats")
             
-        return data
+            for seq, row in enumerate(rows):
+                data_length = row["data_length"] or 0
+                index_length = row["index_length"] or 0
+                data_free = row["data_free"] or 0
+                total_size = data_length + index_length
+                
+                push(largest, total_size, seq, {
+                    "table_schema": row["table_schema"],
+                    "table_name": row["table_name"],
+                    "table_rows": row["table_rows"],
+                    "data_length": row["data_length"],
+                    "index_length": row["index_length"],
+                    "total_size": total_size,
+                    "data_free": row["data_free"],
+                })
+                
+                if data_free > 0 and total_size > 0:
+                    push(fragmented, data_free, seq, {
+                        "table_schema": row["table_schema"],
+                        "table_name": row["table_name"],
+                        "data_free": data_free,
+                        "total_size": total_size,
+                        "fragmentation_pct": round(data_free / (total_size + 1) * 100, 2),
+                    })
+                
+                if not row["has_pk"]:
+                    push(without_pk, total_size, seq, {
+                        "table_schema": row["table_schema"],
+                        "table_name": row["table_name"],
+                        "table_rows": row["table_rows"],
+                        "total_size": total_size,
+                    })
+        except Exception as err:
+            if is_connection_error(err):
+                raise
+            _LOGGER.warning("Failed to get table statistics: %s", err)
+            largest, fragmented, without_pk = [], [], []
+        
+        def ranked(heap):
+            return [row for _, _, row in sorted(heap, key=lambda entry: entry[0], reverse=True)]
+        
+        return {
+            "largest_tables": ranked(largest),
+            "fragmented_tables": ranked(fragmented),
+            "tables_without_pk": ranked(without_pk),
+        }
     
     def get_query_cache_info(self) -> Dict[str, Any]:
         """Get query cache information."""
-        conn = self._get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("""
-                SHOW VARIABLES LIKE 'query_cache_%'
-            """)
-            
-            cache_vars = {row["Variable_name"]: row["Value"] for row in cursor.fetchall()}
-            
-            # Check if query cache is enabled
-            if cache_vars.get("query_cache_type", "OFF") == "OFF":
-                return {"enabled": False}
-            
-            cursor.execute("""
-                SHOW STATUS LIKE 'Qcache_%'
-            """)
-            
-            cache_status = {row["Variable_name"]: row["Value"] for row in cursor.fetchall()}
-            
-            # Calculate hit rate
-            hits = int(cache_status.get("Qcache_hits", 0))
-            inserts = int(cache_status.get("Qcache_inserts", 0))
-            
-            hit_rate = 0
-            if hits + inserts > 0:
-                hit_rate = (hits / (hits + inserts)) * 100
-            
-            return {
-                "enabled": True,
-                "size": cache_vars.get("query_cache_size", 0),
-                "limit": cache_vars.get("query_cache_limit", 0),
-                "hits": hits,
-                "inserts": inserts,
-                "hit_rate": hit_rate,
-                "queries_in_cache": int(cache_status.get("Qcache_queries_in_cache", 0)),
-                "free_memory": int(cache_status.get("Qcache_free_memory", 0)),
-                "free_blocks": int(cache_status.get("Qcache_free_blocks", 0)),
-                "total_blocks": int(cache_status.get("Qcache_total_blocks", 0)),
-            }
+        cache_vars = self._vars_snapshot
+        cache_status = self._status_snapshot
+        
+        # Check if query cache is enabled
+        if cache_vars.get("query_cache_type", "OFF") == "OFF":
+            return {"enabled": False}
+        
+        # Calculate hit rate
+        hits = int(cache_status.get("Qcache_hits", 0))
+        inserts = int(cache_status.get("Qcache_inserts", 0))
+        
+        hit_rate = 0
+        if hits + inserts > 0:
+            hit_rate = (hits / (hits + inserts)) * 100
+        
+        return {
+            "enabled": True,
+            "size": cache_vars.get("query_cache_size", 0),
+            "limit": cache_vars.get("query_cache_limit", 0),
+            "hits": hits,
+            "inserts": inserts,
+            "hit_rate": hit_rate,
+            "queries_in_cache": int(cache_status.get("Qcache_queries_in_cache", 0)),
+            "free_memory": int(cache_status.get("Qcache_free_memory", 0)),
+            "free_blocks": int(cache_status.get("Qcache_free_blocks", 0)),
+            "total_blocks": int(cache_status.get("Qcache_total_blocks", 0)),
+        }
     
     def get_binlog_info(self) -> Dict[str, Any]:
         """Get binary log information."""
-        conn = self._get_connection()
         data = {}
         
         try:
-            with conn.cursor() as cursor:
-                # Check if binary logging is enabled
-                cursor.execute("SHOW VARIABLES LIKE 'log_bin'")
-                log_bin = cursor.fetchone()
-                
-                if not log_bin or log_bin["Value"] != "ON":
-                    return {"enabled": False}
-                
-                data["enabled"] = True
-                
-                # Get binary log files
-                cursor.execute("SHOW BINARY LOGS")
-                logs = cursor.fetchall()
-                
-                data["log_files"] = logs
-                data["log_count"] = len(logs)
-                data["total_size"] = sum(log.get("File_size", 0) for log in logs)
-                
-                # Get current log file
-                cursor.execute("SHOW MASTER STATUS")
-                master_status = cursor.fetchone()
-                if master_status:
-                    data["current_log"] = master_status.get("File")
-                    data["current_position"] = master_status.get("Position")
-                
-                # Get binlog format
-                cursor.execute("SHOW VARIABLES LIKE 'binlog_format'")
-                binlog_format = cursor.fetchone()
-                data["format"] = binlog_format["Value"] if binlog_format else "UNKNOWN"
-                
+            # Check if binary logging is enabled, reading the format alongside
+            variables = self._vars_snapshot
+            if variables.get("log_bin") != "ON":
+                return {"enabled": False}
+            
+            data["enabled"] = True
+            
+            # Binary log files and current position in one round-trip
+            logs, master_rows = self.fetch_batch([
+                "SHOW BINARY LOGS",
+                "SHOW MASTER STATUS",
+            ])
+            
+            data["log_files"] = logs
+            data["log_count"] = len(logs)
+            data["total_size"] = sum(log.get("File_size", 0) for log in logs)
+            
+            if master_rows:
+                data["current_log"] = master_rows[0].get("File")
+                data["current_position"] = master_rows[0].get("Position")
+            
+            data["format"] = variables.get("binlog_format", "UNKNOWN")
+            
         except Exception as err:
+            if is_connection_error(err):
+                raise
             _LOGGER.debug("Could not get binary log info: %s", err)
             data["enabled"] = False
             data["error"] = str(err)
@@ -618,75 +1153,67 @@ class MySQLClient:
     
     def get_connection_pool_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics."""
-        conn = self._get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("""
+        with self._cursor() as (conn, cursor):
+            cursor.execute(f"""
                 SELECT 
                     COUNT(*) as total_connections,
                     SUM(CASE WHEN COMMAND = 'Sleep' THEN 1 ELSE 0 END) as idle_connections,
                     SUM(CASE WHEN COMMAND != 'Sleep' THEN 1 ELSE 0 END) as active_connections,
                     MAX(TIME) as max_connection_time,
-                    AVG(TIME) as avg_connection_time
-                FROM INFORMATION_SCHEMA.PROCESSLIST
+                    AVG(TIME) as avg_connection_time,
+                    @@max_connections as max_connections
+                FROM {self._processlist_source()}
             """)
             pool_stats = cursor.fetchone()
-            
-            cursor.execute("SHOW VARIABLES LIKE 'max_connections'")
-            max_conn = cursor.fetchone()
-            
-            cursor.execute("SHOW STATUS LIKE 'Max_used_connections'")
-            max_used = cursor.fetchone()
-            
-            return {
-                "total_connections": pool_stats["total_connections"] or 0,
-                "idle_connections": pool_stats["idle_connections"] or 0,
-                "active_connections": pool_stats["active_connections"] or 0,
-                "max_connection_time": pool_stats["max_connection_time"] or 0,
-                "avg_connection_time": float(pool_stats["avg_connection_time"] or 0),
-                "max_connections": int(max_conn["Value"]) if max_conn else 0,
-                "max_used_connections": int(max_used["Value"]) if max_used else 0,
-                "connection_usage_pct": (
-                    (int(max_used["Value"]) / int(max_conn["Value"])) * 100
-                    if max_conn and max_used and int(max_conn["Value"]) > 0
-                    else 0
-                ),
-            }
+        max_connections = int(pool_stats["max_connections"] or 0)
+        max_used = int(self._status_snapshot.get("Max_used_connections", 0))
+        
+        return {
+            "total_connections": pool_stats["total_connections"] or 0,
+            "idle_connections": pool_stats["idle_connections"] or 0,
+            "active_connections": pool_stats["active_connections"] or 0,
+            "max_connection_time": pool_stats["max_connection_time"] or 0,
+            "avg_connection_time": float(pool_stats["avg_connection_time"] or 0),
+            "max_connections": max_connections,
+            "max_used_connections": max_used,
+            "connection_usage_pct": (
+                (max_used / max_connections) * 100 if max_connections > 0 else 0
+            ),
+        }
     
     def get_slow_query_stats(self) -> Dict[str, Any]:
         """Get slow query statistics."""
-        conn = self._get_connection()
         data = {}
         
-        with conn.cursor() as cursor:
-            # Check if slow query log is enabled
-            cursor.execute("SHOW VARIABLES LIKE 'slow_query_log'")
-            slow_log = cursor.fetchone()
-            
-            if not slow_log or slow_log["Value"] != "ON":
-                return {"enabled": False}
-            
-            data["enabled"] = True
-            
-            # Get slow query settings
-            cursor.execute("""
-                SHOW VARIABLES WHERE Variable_name IN (
-                    'slow_query_log_file',
-                    'long_query_time',
-                    'log_queries_not_using_indexes'
-                )
-            """)
-            
-            for row in cursor.fetchall():
-                data[row["Variable_name"]] = row["Value"]
-            
-            # Get slow query count
-            cursor.execute("SHOW STATUS LIKE 'Slow_queries'")
-            slow_count = cursor.fetchone()
-            data["slow_query_count"] = int(slow_count["Value"]) if slow_count else 0
-            
-            # Try to get slow queries from performance schema if available
-            try:
-                cursor.execute("""
+        variables = self._global_values("VARIABLES", _SLOW_QUERY_VARS)
+        
+        # Check if slow query log is enabled
+        if variables.get("slow_query_log") != "ON":
+            return {"enabled": False}
+        
+        data["enabled"] = True
+        
+        # Slow query settings
+        for name in ("slow_query_log_file", "long_query_time", "log_queries_not_using_indexes"):
+            if name in variables:
+                data[name] = variables[name]
+        long_query_time = float(variables.get("long_query_time", 10))
+        
+        # Slow query count
+        status = self._global_values("STATUS", ("Slow_queries",))
+        data["slow_query_count"] = int(status.get("Slow_queries", 0))
+        
+        # Top slow statements, only when digests are actually collected
+        data["top_slow_queries"] = []
+        if not self._cached(
+            "digests_available", METADATA_TTL, self._fetch_digests_available
+        ):
+            return data
+        
+        try:
+            # Timer columns are in picoseconds
+            data["top_slow_queries"] = list(self._stream_query(
+                """
                     SELECT 
                         DIGEST_TEXT,
                         COUNT_STAR,
@@ -696,166 +1223,141 @@ class MySQLClient:
                         SUM_ROWS_EXAMINED,
                         SUM_ROWS_SENT
                     FROM performance_schema.events_statements_summary_by_digest
-                    WHERE AVG_TIMER_WAIT > %s * 1000000000
+                    WHERE AVG_TIMER_WAIT > %s * 1000000000000
                         AND DIGEST_TEXT IS NOT NULL
                     ORDER BY SUM_TIMER_WAIT DESC
                     LIMIT 10
-                """, (float(data.get("long_query_time", 10)),))
-                
-                data["top_slow_queries"] = cursor.fetchall()
-            except Exception:
-                data["top_slow_queries"] = []
+                """,
+                (long_query_time,),
+                name="mm_slow_statements",
+            ))
+        except pymysql.Error as err:
+            if is_connection_error(err):
+                raise
+            _LOGGER.debug("Could not get top slow queries: %s", err)
         
         return data
     
     def get_lock_wait_stats(self) -> Dict[str, Any]:
         """Get lock wait statistics."""
-        conn = self._get_connection()
         data = {}
         
         try:
-            with conn.cursor() as cursor:
-                # InnoDB lock waits - check if sys schema exists
-                try:
-                    cursor.execute("""
-                        SELECT 
-                            waiting_trx_id,
-                            waiting_pid,
-                            waiting_query,
-                            blocking_trx_id,
-                            blocking_pid,
-                            blocking_query,
-                            wait_started,
-                            wait_age_secs,
-                            locked_table,
-                            locked_index
-                        FROM sys.innodb_lock_waits
-                        LIMIT 10
-                    """)
-                    data["current_lock_waits"] = cursor.fetchall()
-                except Exception:
-                    # Try alternative method
-                    cursor.execute("""
-                        SELECT 
-                            r.trx_id AS waiting_trx_id,
-                            r.trx_mysql_thread_id AS waiting_pid,
-                            r.trx_query AS waiting_query,
-                            b.trx_id AS blocking_trx_id,
-                            b.trx_mysql_thread_id AS blocking_pid,
-                            b.trx_query AS blocking_query,
-                            r.trx_wait_started AS wait_started
-                        FROM information_schema.innodb_lock_waits w
-                        JOIN information_schema.innodb_trx r ON w.requesting_trx_id = r.trx_id
-                        JOIN information_schema.innodb_trx b ON w.blocking_trx_id = b.trx_id
-                        LIMIT 10
-                    """)
-                    data["current_lock_waits"] = cursor.fetchall()
-                
-                # Lock wait timeout setting
-                cursor.execute("SHOW VARIABLES LIKE 'innodb_lock_wait_timeout'")
-                timeout = cursor.fetchone()
-                data["lock_wait_timeout"] = int(timeout["Value"]) if timeout else 50
-                
-                # Historical lock wait stats
-                cursor.execute("""
-                    SHOW STATUS WHERE Variable_name IN (
-                        'Innodb_row_lock_waits',
-                        'Innodb_row_lock_time',
-                        'Innodb_row_lock_time_avg',
-                        'Innodb_row_lock_time_max',
-                        'Table_locks_waited'
-                    )
-                """)
-                
-                for row in cursor.fetchall():
-                    data[row["Variable_name"]] = int(row["Value"])
+            source = self._cached(
+                "lock_waits_source", METADATA_TTL, self._fetch_lock_waits_source
+            )
+            
+            # The timeout setting comes from the variables snapshot
+            data["lock_wait_timeout"] = int(
+                self._vars_snapshot.get("innodb_lock_wait_timeout", 50)
+            )
+            
+            # Historical lock wait stats
+            for name, value in self._global_values("STATUS", _LOCK_STATUS_VARS).items():
+                data[name] = int(value)
+            
+            # InnoDB lock waits from whichever view the server provides
+            data["current_lock_waits"] = (
+                list(self._stream_query(
+                    _LOCK_WAIT_QUERIES[source], name=f"mm_lock_waits_{source}"
+                ))
+                if source
+                else []
+            )
         except Exception as err:
-            _LOGGER.debug("Could not get lock wait stats: %s", err)
+            if is_connection_error(err):
+                raise
+            if _is_query_timeout(err):
+                _LOGGER.warning("Lock wait query timed out: %s", err)
+            else:
+                _LOGGER.debug("Could not get lock wait stats: %s", err)
             data["current_lock_waits"] = []
         
         return data
     
-    def get_buffer_pool_stats(self) -> Dict[str, Any]:
-        """Get InnoDB buffer pool statistics."""
-        conn = self._get_connection()
+    def get_buffer_pool_stats(self, detail: bool = False) -> Dict[str, Any]:
+        """Get InnoDB buffer pool statistics.
+        
+        Per-pool rows are only read when detail is requested; the
+        aggregate alone is enough for the sensors.
+        """
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT 
+            # Totals are aggregated server-side; the per-pool rows only
+            # carry the columns that are actually reported. Both come back
+            # as tuples, so no dict is built per row.
+            queries = [
+                ("mm_buffer_pool_totals", f"""
+                    SELECT /*+ MAX_EXECUTION_TIME({QUERY_TIMEOUT_MS}) */
+                        COUNT(*) as pool_count,
+                        SUM(POOL_SIZE) as total_size,
+                        SUM(FREE_BUFFERS) as total_free,
+                        SUM(DATABASE_PAGES) as total_database_pages,
+                        SUM(MODIFIED_DATABASE_PAGES) as total_dirty_pages,
+                        AVG(HIT_RATE) as avg_hit_rate,
+                        100 * (SUM(POOL_SIZE) - SUM(FREE_BUFFERS))
+                            / NULLIF(SUM(POOL_SIZE), 0) as usage_pct,
+                        100 * SUM(MODIFIED_DATABASE_PAGES)
+                            / NULLIF(SUM(POOL_SIZE), 0) as dirty_pct
+                    FROM information_schema.INNODB_BUFFER_POOL_STATS
+                """),
+            ]
+            if detail:
+                queries.append(("mm_buffer_pools", f"""
+                    SELECT /*+ MAX_EXECUTION_TIME({QUERY_TIMEOUT_MS}) */
                         POOL_ID,
                         POOL_SIZE,
                         FREE_BUFFERS,
                         DATABASE_PAGES,
-                        OLD_DATABASE_PAGES,
                         MODIFIED_DATABASE_PAGES,
-                        PENDING_DECOMPRESS,
-                        PENDING_READS,
-                        PENDING_FLUSH_LRU,
-                        PENDING_FLUSH_LIST,
-                        PAGES_MADE_YOUNG,
-                        PAGES_NOT_MADE_YOUNG,
-                        PAGES_MADE_YOUNG_RATE,
-                        PAGES_MADE_NOT_YOUNG_RATE,
-                        NUMBER_PAGES_READ,
-                        NUMBER_PAGES_CREATED,
-                        NUMBER_PAGES_WRITTEN,
-                        PAGES_READ_RATE,
-                        PAGES_CREATE_RATE,
-                        PAGES_WRITTEN_RATE,
-                        NUMBER_PAGES_GET,
                         HIT_RATE,
-                        YOUNG_MAKE_PER_THOUSAND_GETS,
-                        NOT_YOUNG_MAKE_PER_THOUSAND_GETS,
-                        NUMBER_PAGES_READ_AHEAD,
-                        NUMBER_READ_AHEAD_EVICTED,
-                        READ_AHEAD_RATE,
-                        READ_AHEAD_EVICTED_RATE,
-                        LRU_IO_TOTAL,
-                        LRU_IO_CURRENT,
-                        UNCOMPRESS_TOTAL,
-                        UNCOMPRESS_CURRENT
+                        PAGES_READ_RATE,
+                        PAGES_WRITTEN_RATE
                     FROM information_schema.INNODB_BUFFER_POOL_STATS
-                """)
-                
-                pools = cursor.fetchall()
-                
-                if not pools:
-                    return {
-                        "pool_count": 0,
-                        "total_size": 0,
-                        "total_free": 0,
-                        "total_database_pages": 0,
-                        "total_dirty_pages": 0,
-                        "avg_hit_rate": 0,
-                        "pools": []
-                    }
-                
-                # Aggregate stats
-                total_stats = {
-                    "pool_count": len(pools),
-                    "total_size": sum(p["POOL_SIZE"] or 0 for p in pools),
-                    "total_free": sum(p["FREE_BUFFERS"] or 0 for p in pools),
-                    "total_database_pages": sum(p["DATABASE_PAGES"] or 0 for p in pools),
-                    "total_dirty_pages": sum(p["MODIFIED_DATABASE_PAGES"] or 0 for p in pools),
-                    "avg_hit_rate": sum(p["HIT_RATE"] or 0 for p in pools) / len(pools) if pools else 0,
-                    "pools": pools
+                """))
+            
+            results = self.fetch_batch(queries, pymysql.cursors.Cursor)
+            (
+                pool_count,
+                total_size,
+                total_free,
+                total_database_pages,
+                total_dirty_pages,
+                avg_hit_rate,
+                usage_pct,
+                dirty_pct,
+            ) = results[0][0]
+            pools = (
+                [BufferPoolInstance._make(row) for row in results[1]] if detail else []
+            )
+            
+            if not pool_count:
+                return {
+                    "pool_count": 0,
+                    "total_size": 0,
+                    "total_free": 0,
+                    "total_database_pages": 0,
+                    "total_dirty_pages": 0,
+                    "avg_hit_rate": 0,
+                    "pools": []
                 }
-                
-                # Calculate usage percentage
-                if total_stats["total_size"] > 0:
-                    total_stats["usage_pct"] = (
-                        (total_stats["total_size"] - total_stats["total_free"]) / 
-                        total_stats["total_size"]
-                    ) * 100
-                    total_stats["dirty_pct"] = (
-                        total_stats["total_dirty_pages"] / total_stats["total_size"]
-                    ) * 100
-                else:
-                    total_stats["usage_pct"] = 0
-                    total_stats["dirty_pct"] = 0
-                
-                return total_stats
+            
+            total_stats = {
+                "pool_count": pool_count,
+                "total_size": int(total_size or 0),
+                "total_free": int(total_free or 0),
+                "total_database_pages": int(total_database_pages or 0),
+                "total_dirty_pages": int(total_dirty_pages or 0),
+                "avg_hit_rate": avg_hit_rate or 0,
+                # NULLIF yields NULL for an empty pool instead of dividing by zero
+                "usage_pct": usage_pct or 0,
+                "dirty_pct": dirty_pct or 0,
+                "pools": pools
+            }
+            
+            return total_stats
         except Exception as err:
+            if is_connection_error(err):
+                raise
             _LOGGER.warning("Failed to get buffer pool stats: %s", err)
             return {
                 "pool_count": 0,
@@ -869,71 +1371,43 @@ class MySQLClient:
     
     def get_transaction_info(self) -> Dict[str, Any]:
         """Get transaction information."""
-        conn = self._get_connection()
         data = {}
         
         try:
-            with conn.cursor() as cursor:
-                # Active transactions
-                cursor.execute("""
-                    SELECT 
-                        trx_id,
-                        trx_state,
-                        trx_started,
-                        trx_requested_lock_id,
-                        trx_wait_started,
-                        trx_weight,
-                        trx_mysql_thread_id,
-                        trx_query,
-                        trx_operation_state,
-                        trx_tables_in_use,
-                        trx_tables_locked,
-                        trx_rows_locked,
-                        trx_rows_modified
-                    FROM information_schema.INNODB_TRX
-                    ORDER BY trx_started
-                """)
-                
-                transactions = cursor.fetchall()
-                data["active_transactions"] = transactions
-                data["transaction_count"] = len(transactions)
-                
-                # Long running transactions
-                data["long_running_transactions"] = [
-                    trx for trx in transactions
-                    if trx["trx_started"] and 
-                    (datetime.now() - trx["trx_started"]).total_seconds() > 60
-                ]
-                
-                # Transaction isolation level - try both variables
-                try:
-                    cursor.execute("SELECT @@transaction_isolation as isolation_level")
-                    result = cursor.fetchone()
-                    if result:
-                        data["default_isolation_level"] = result["isolation_level"]
-                except Exception:
-                    # Fallback for older MySQL versions
-                    try:
-                        cursor.execute("SELECT @@tx_isolation as isolation_level")
-                        result = cursor.fetchone()
-                        if result:
-                            data["default_isolation_level"] = result["isolation_level"]
-                    except Exception:
-                        data["default_isolation_level"] = "UNKNOWN"
-                
-                # Rollback segment info
-                cursor.execute("""
-                    SHOW STATUS WHERE Variable_name IN (
-                        'Com_commit',
-                        'Com_rollback',
-                        'Com_rollback_to_savepoint',
-                        'Com_savepoint'
-                    )
-                """)
-                
-                for row in cursor.fetchall():
-                    data[row["Variable_name"]] = int(row["Value"])
+            source = self._cached(
+                "transactions_source", METADATA_TTL, self._fetch_transactions_source
+            )
+            
+            # The transaction list is streamed; the server computes each
+            # age, so long running ones are picked out with an int compare
+            transactions = []
+            long_running = []
+            for trx in self._stream_query(
+                _TRANSACTION_QUERIES[source], name=f"mm_transactions_{source}"
+            ):
+                transactions.append(trx)
+                if (trx["age_secs"] or 0) > 60:
+                    long_running.append(trx)
+            
+            data["active_transactions"] = transactions
+            data["transaction_count"] = len(transactions)
+            data["long_running_transactions"] = long_running
+            
+            # Transaction isolation level, GLOBAL scope since our own
+            # sessions run READ COMMITTED
+            isolation = self._global_values("VARIABLES", _TRX_ISOLATION_VARS)
+            data["default_isolation_level"] = (
+                isolation.get("transaction_isolation")
+                or isolation.get("tx_isolation")
+                or "UNKNOWN"
+            )
+            
+            # Commit and rollback counters
+            for name, value in self._global_values("STATUS", _TRX_STATUS_VARS).items():
+                data[name] = int(value)
         except Exception as err:
+            if is_connection_error(err):
+                raise
             _LOGGER.warning("Failed to get transaction info: %s", err)
             data["active_transactions"] = []
             data["transaction_count"] = 0
@@ -943,44 +1417,56 @@ class MySQLClient:
     
     def get_storage_engine_stats(self) -> Dict[str, Any]:
         """Get storage engine statistics."""
-        conn = self._get_connection()
-        with conn.cursor() as cursor:
-            # Storage engines in use
-            cursor.execute("""
-                SELECT 
-                    ENGINE,
-                    COUNT(*) as table_count,
-                    SUM(DATA_LENGTH) as total_data_size,
-                    SUM(INDEX_LENGTH) as total_index_size,
-                    SUM(DATA_LENGTH + INDEX_LENGTH) as total_size
-                FROM information_schema.TABLES
-                WHERE TABLE_SCHEMA NOT IN %s
-                    AND ENGINE IS NOT NULL
-                GROUP BY ENGINE
-            """, (SYSTEM_DATABASES,))
-            
-            engines = {}
-            for row in cursor.fetchall():
-                engines[row["ENGINE"]] = {
-                    "table_count": row["table_count"],
-                    "data_size": row["total_data_size"] or 0,
-                    "index_size": row["total_index_size"] or 0,
-                    "total_size": row["total_size"] or 0,
-                }
-            
-            # Available storage engines
-            cursor.execute("SHOW ENGINES")
-            available_engines = {}
-            for row in cursor.fetchall():
-                available_engines[row["Engine"]] = {
-                    "support": row["Support"],
-                    "comment": row["Comment"],
-                    "transactions": row.get("Transactions", "NO"),
-                    "xa": row.get("XA", "NO"),
-                    "savepoints": row.get("Savepoints", "NO"),
-                }
-            
-            return {
-                "engines_in_use": engines,
-                "available_engines": available_engines,
+        where_clause = self._schema_filter((), (), column="s.SCHEMA_NAME")
+        
+        # Engines in use and available engines in one round-trip.
+        # Driving from SCHEMATA filters the handful of schema rows first,
+        # so TABLES is only read for user schemas.
+        try:
+            engine_rows, available_rows = self.fetch_batch([
+                f"""
+                    SELECT /*+ MAX_EXECUTION_TIME({HEAVY_QUERY_TIMEOUT_MS}) */
+                        t.ENGINE,
+                        COUNT(*) as table_count,
+                        SUM(t.DATA_LENGTH) as total_data_size,
+                        SUM(t.INDEX_LENGTH) as total_index_size,
+                        SUM(t.DATA_LENGTH + t.INDEX_LENGTH) as total_size
+                    FROM information_schema.SCHEMATA s
+                    JOIN information_schema.TABLES t
+                        ON t.TABLE_SCHEMA = s.SCHEMA_NAME
+                    WHERE {where_clause}
+                        AND t.TABLE_TYPE = 'BASE TABLE'
+                        AND t.ENGINE IS NOT NULL
+                    GROUP BY t.ENGINE
+                """,
+                "SHOW ENGINES",
+            ])
+        except pymysql.err.OperationalError as err:
+            if not _is_query_timeout(err):
+                raise
+            _LOGGER.warning("Storage engine query timed out: %s", err)
+            engine_rows, available_rows = [], []
+        
+        engines = {}
+        for row in engine_rows:
+            engines[row["ENGINE"]] = {
+                "table_count": row["table_count"],
+                "data_size": row["total_data_size"] or 0,
+                "index_size": row["total_index_size"] or 0,
+                "total_size": row["total_size"] or 0,
+            }
+        
+        available_engines = {}
+        for row in available_rows:
+            available_engines[row["Engine"]] = {
+                "support": row["Support"],
+                "comment": row["Comment"],
+                "transactions": row.get("Transactions", "NO"),
+                "xa": row.get("XA", "NO"),
+                "savepoints": row.get("Savepoints", "NO"),
             }
+        
+        return {
+            "engines_in_use": engines,
+            "available_engines": available_engines,
+        }
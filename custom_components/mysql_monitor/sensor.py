@@ -1,6 +1,10 @@
 """Sensor platform for MySQL Monitor."""
 import logging
-from typing import Any, Dict, List, Optional
+import math
+from bisect import bisect_right
+from itertools import chain
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -13,8 +17,7 @@ from homeassistant.const import (
     UnitOfInformation,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -24,97 +27,199 @@ from homeassistant.helpers.update_coordinator import (
 from .const import (
     DOMAIN,
     METRIC_CATEGORIES,
-    METRIC_UNITS,
+    METRIC_TO_UNIT,
+    CONNECTION_ERROR_METRICS,
     QUERY_CACHE_METRICS,
     REPLICATION_METRICS,
-    CONNECTION_ERROR_METRICS,
     RESOURCE_THRESHOLDS,
     SENSOR_ICONS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marks the last written state as never written (the state may be None)
+_UNSET = object()
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up MySQL Monitor sensors."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+# Float states closer than this are treated as unchanged
+_FLOAT_EPSILON = 1e-9
+
+# Indexed by bisect_right over a (warning, critical) threshold pair
+_RESOURCE_STATUS = ("normal", "warning", "critical")
+
+# Bytes -> GiB factor for the size attributes
+_GIB_INV = 1.0 / (1024 ** 3)
+
+# METRIC_UNITS unit -> (device class, native unit) for global status sensors
+_UNIT_SPEC = {
+    "bytes": (SensorDeviceClass.DATA_SIZE, UnitOfInformation.BYTES),
+    "milliseconds": (SensorDeviceClass.DURATION, UnitOfTime.MILLISECONDS),
+    "percentage": (None, PERCENTAGE),
+}
+
+
+class _MetricSpec(NamedTuple):
+    """Construction-time details of a global status sensor."""
     
-    sensors = []
+    sensor_type: str
+    display_name: str
+    # (device class, native unit), or None for plain counters
+    unit_spec: Optional[Tuple[Optional[SensorDeviceClass], str]]
+
+
+def _metric_spec(metric: str) -> _MetricSpec:
+    """Resolve the sensor type, display name and unit for a status metric."""
+    return _MetricSpec(
+        metric.lower(),
+        metric.replace("_", " ").title(),
+        _UNIT_SPEC.get(METRIC_TO_UNIT.get(metric)),
+    )
+
+
+# Every metric a global status sensor can be created for, resolved at import
+_METRIC_SPEC = {
+    metric: _metric_spec(metric)
+    for metric in chain(
+        chain.from_iterable(METRIC_CATEGORIES.values()),
+        QUERY_CACHE_METRICS,
+        REPLICATION_METRICS,
+    )
+}
+
+# (metric_type, name suffix) sensors created for every database; without
+# the legacy split option only the first one is, carrying the rest as
+# attributes
+_DATABASE_METRICS = (
+    ("total_size", "Size"),
+    ("table_count", "Tables"),
+    ("total_rows", "Rows"),
+)
+# InnoDB row lock counters added to every innodb category sensor
+_INNODB_LOCK_METRICS = (
+    "Innodb_row_lock_waits",
+    "Innodb_row_lock_time",
+    "Innodb_row_lock_time_avg",
+    "Innodb_row_lock_time_max",
+    "Innodb_row_lock_current_waits",
+)
+# (status variable, attribute key) pairs, lowercased once at import
+_INNODB_LOCK_METRICS_LOWER = tuple((m, m.lower()) for m in _INNODB_LOCK_METRICS)
+_CONN_ERR_LOWER = tuple((m, m.lower()) for m in CONNECTION_ERROR_METRICS)
+# Replication state indexed by (IO running) * 2 + (SQL running)
+_REPL_STATE = ("Slave Stopped", "Slave Partial", "Slave Partial", "Slave Running")
+# The coordinator zero-fills these counters in global_status_num
+_CE_GETTER = itemgetter(*CONNECTION_ERROR_METRICS)
+# Performance sensors created for every entry
+_PERFORMANCE_METRICS = (
+    "buffer_pool_hit_rate",
+    "connections_usage",
+    "slow_query_logs",  # 이름 변경
+    "transaction_count",
+)
+
+
+def _same_written_state(old: Any, new: Tuple[bool, Any, Dict[str, Any]]) -> bool:
+    """Return True if (available, value, attributes) matches what was written."""
+    if old is _UNSET or old[0] != new[0] or old[2] != new[2]:
+        return False
+    
+    old_value, new_value = old[1], new[1]
+    if (
+        (isinstance(old_value, float) or isinstance(new_value, float))
+        and isinstance(old_value, (int, float))
+        and isinstance(new_value, (int, float))
+    ):
+        return math.isclose(old_value, new_value, rel_tol=0.0, abs_tol=_FLOAT_EPSILON)
+    return old_value == new_value
+
+
+def _iter_sensors(coordinator, entry: ConfigEntry) -> Iterator[SensorEntity]:
+    """Yield the fixed (non-database) sensors for an entry."""
+    data = coordinator.data or {}
     
     # Get feature flags
-    features = coordinator.data.get("features", {})
+    features = data.get("features") or {}
     enable_query_cache = features.get("query_cache", False)
     enable_replication = features.get("replication", False)
     
-    # Server info sensor
-    sensors.append(MySQLServerInfoSensor(coordinator, entry))
-    
-    # Global status sensors (Slow_queries는 여기서 제외)
-    for category, metrics in METRIC_CATEGORIES.items():
-        for metric in metrics:
-            if metric != "Slow_queries":  # Slow_queries는 별도 처리
-                sensors.append(
-                    MySQLGlobalStatusSensor(coordinator, entry, metric, category)
-                )
-    
-    # Connection Errors aggregate sensor
-    sensors.append(MySQLConnectionErrorsSensor(coordinator, entry))
-    
-    # Query cache sensors (conditional)
+    yield MySQLServerInfoSensor(coordinator, entry)
+    
+    # Global status sensors, including the cache/replication categories
+    # when enabled (Slow_queries는 별도 처리)
+    yield from (
+        MySQLGlobalStatusSensor(coordinator, entry, metric, category)
+        for category, metrics in coordinator.active_categories.items()
+        for metric in metrics
+        if metric != "Slow_queries"
+    )
+    
+    # Connection errors aggregate and system resource sensors
+    yield MySQLConnectionErrorsSensor(coordinator, entry)
+    yield MySQLSystemResourceSensor(coordinator, entry, "cpu_percent", "CPU Usage")
+    yield MySQLSystemResourceSensor(coordinator, entry, "memory_percent", "Memory Usage")
+    
+    # Performance sensors, plus the conditional query cache/replication ones
+    yield from (
+        MySQLPerformanceSensor(coordinator, entry, metric_type)
+        for metric_type in _PERFORMANCE_METRICS
+    )
     if enable_query_cache:
-        for metric in QUERY_CACHE_METRICS:
-            sensors.append(
-                MySQLGlobalStatusSensor(coordinator, entry, metric, "cache")
-            )
-    
-    # Replication sensors (conditional)
-    if enable_replication:
-        for metric in REPLICATION_METRICS:
-            sensors.append(
-                MySQLGlobalStatusSensor(coordinator, entry, metric, "replication")
-            )
-    
-    # System resource sensors
-    sensors.extend([
-        MySQLSystemResourceSensor(coordinator, entry, "cpu_percent", "CPU Usage"),
-        MySQLSystemResourceSensor(coordinator, entry, "memory_percent", "Memory Usage"),
-    ])
-    
-    # Database size sensors
-    if coordinator.data and "database_sizes" in coordinator.data:
-        for db_name in coordinator.data["database_sizes"]:
-            sensors.extend([
-                MySQLDatabaseSensor(coordinator, entry, db_name, "total_size", "Size"),
-                MySQLDatabaseSensor(coordinator, entry, db_name, "table_count", "Tables"),
-                MySQLDatabaseSensor(coordinator, entry, db_name, "total_rows", "Rows"),
-            ])
-    
-    # Performance sensors
-    sensors.extend([
-        MySQLPerformanceSensor(coordinator, entry, "buffer_pool_hit_rate"),
-        MySQLPerformanceSensor(coordinator, entry, "connections_usage"),
-        MySQLPerformanceSensor(coordinator, entry, "slow_query_logs"),  # 이름 변경
-        MySQLPerformanceSensor(coordinator, entry, "transaction_count"),
-    ])
-    
-    # Query cache hit rate sensor (conditional)
-    if enable_query_cache:
-        sensors.append(MySQLPerformanceSensor(coordinator, entry, "query_cache_hit_rate"))
+        yield MySQLPerformanceSensor(coordinator, entry, "query_cache_hit_rate")
+    if enable_replication and data.get("replication_status"):
+        yield MySQLReplicationSensor(coordinator, entry)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up MySQL Monitor sensors."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     
-    # Replication sensors (conditional)
-    if enable_replication and coordinator.data.get("replication_status"):
-        sensors.append(MySQLReplicationSensor(coordinator, entry))
+    async_add_entities(_iter_sensors(coordinator, entry))
+    
+    db_metrics = (
+        _DATABASE_METRICS if coordinator.split_db_sensors else _DATABASE_METRICS[:1]
+    )
+    
+    @callback
+    def _sync_db_sensors() -> None:
+        """Add sensors for databases that have not been registered yet."""
+        sizes = (coordinator.data or {}).get("database_sizes") or {}
+        new_dbs = [
+            db_name
+            for db_name, db_data in sizes.items()
+            if db_name not in coordinator.registered_dbs
+            and (db_data.get("total_size") or 0) >= coordinator.db_min_size
+        ]
+        if not new_dbs:
+            return
+        
+        coordinator.registered_dbs.update(new_dbs)
+        async_add_entities(
+            MySQLDatabaseSensor(coordinator, entry, db_name, metric_type, name_suffix)
+            for db_name in new_dbs
+            for metric_type, name_suffix in db_metrics
+        )
     
-    async_add_entities(sensors)
+    # Database size sensors, for databases present now and created later
+    _sync_db_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_sync_db_sensors))
 
 
 class MySQLBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for MySQL sensors."""
     
+    # Entity parents keep a __dict__ for the _attr_* values; the state
+    # this integration adds per sensor lives in slots
+    __slots__ = (
+        "_entry",
+        "_snapshot_version",
+        "_cached_state",
+        "_cached_attrs",
+        "_last_written",
+    )
+    
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -125,54 +230,109 @@ class MySQLBaseSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
-        self._sensor_type = sensor_type
-        self._name_suffix = name_suffix
+        # Plain _attr_* values are served by Entity without a property
+        # override; identity never changes, so it is built once
+        self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
+        self._attr_name = f"MySQL {name_suffix}"
+        # One DeviceInfo per entry, shared by all of its sensors
+        self._attr_device_info = coordinator.device_info
+        # State and attributes computed for coordinator update_version
+        # _snapshot_version; properties serve these until the next refresh
+        self._snapshot_version = -1
+        self._cached_state: Any = None
+        self._cached_attrs: Dict[str, Any] = {}
+        # (available, value, attributes) as last written to the state machine
+        self._last_written: Any = _UNSET
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability, value or attributes changed."""
+        current = (
+            self.available,
+            self.native_value,
+            self.extra_state_attributes,
+        )
+        if _same_written_state(self._last_written, current):
+            return
+        
+        self._last_written = current
+        self.async_write_ha_state()
     
     @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_{self._sensor_type}"
+    def available(self) -> bool:
+        """Return True if the last refresh succeeded and produced data."""
+        return (
+            self.coordinator.last_update_success
+            and self.coordinator.data is not None
+        )
     
     @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"MySQL {self._name_suffix}"
+    def native_value(self) -> Any:
+        """Return the state computed for the current refresh."""
+        return self._snapshot()[0]
     
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"MySQL {self._entry.data['host']}:{self._entry.data['port']}",
-            manufacturer="Pages in Korea (pages.kr)",
-            model="MySQL Server",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the state attributes computed for the current refresh."""
+        return self._snapshot()[1]
+    
+    def _snapshot(self) -> Tuple[Any, Dict[str, Any]]:
+        """Return (state, attributes), computed once per coordinator refresh.
+        
+        The coordinator bumps update_version on every successful refresh,
+        so comparing it is enough to tell when the cached values are stale.
+        It also avoids keeping the previous payload alive per sensor.
+        """
+        coordinator = self.coordinator
+        if not coordinator.last_update_success:
+            return None, {}
+        
+        version = coordinator.update_version
+        if version != self._snapshot_version:
+            self._cached_state, self._cached_attrs = self._compute_snapshot(
+                coordinator.data
+            )
+            self._snapshot_version = version
+        return self._cached_state, self._cached_attrs
+    
+    def _compute_snapshot(
+        self, data: Optional[Dict[str, Any]]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Walk the coordinator data once for both state and attributes."""
+        return self._compute_state(data), self._build_attributes(data)
+    
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> Any:
+        """Compute the state from coordinator data."""
+        return None
+    
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build state attributes from coordinator data."""
+        return {}
 
 
 class MySQLServerInfoSensor(MySQLBaseSensor):
     """MySQL server information sensor."""
     
+    __slots__ = ()
+    
     def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "server_info", "Server Info")
         self._attr_icon = SENSOR_ICONS["default"]
     
-    @property
-    def native_value(self) -> str:
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> str:
         """Return the state."""
-        if self.coordinator.data and "server_info" in self.coordinator.data:
-            info = self.coordinator.data["server_info"]
+        if data and "server_info" in data:
+            info = data["server_info"]
             return f"MySQL {info.get('version', 'Unknown')}"
         return "Unknown"
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Return state attributes."""
-        if not self.coordinator.data or "server_info" not in self.coordinator.data:
+        if not data or "server_info" not in data:
             return {}
         
-        info = self.coordinator.data["server_info"]
+        info = data["server_info"]
         attrs = {
             "version": info.get("version"),
             "hostname": info.get("hostname"),
@@ -180,17 +340,13 @@ class MySQLServerInfoSensor(MySQLBaseSensor):
             "uptime_seconds": info.get("uptime"),
         }
         
-        # Add uptime in human readable format
-        if info.get("uptime"):
-            uptime = info["uptime"]
-            days = uptime // 86400
-            hours = (uptime % 86400) // 3600
-            minutes = (uptime % 3600) // 60
-            attrs["uptime_formatted"] = f"{days}d {hours}h {minutes}m"
+        # Uptime in human readable format, from the coordinator
+        if info.get("uptime_formatted"):
+            attrs["uptime_formatted"] = info["uptime_formatted"]
         
         # Add global variables
-        if "global_variables" in self.coordinator.data:
-            vars_data = self.coordinator.data["global_variables"]
+        if "global_variables" in data:
+            vars_data = data["global_variables"]
             attrs["max_connections"] = vars_data.get("max_connections")
             attrs["innodb_buffer_pool_size"] = vars_data.get("innodb_buffer_pool_size")
             # query_cache_size를 정수로 변환
@@ -208,21 +364,18 @@ class MySQLServerInfoSensor(MySQLBaseSensor):
                 attrs["innodb_lock_wait_timeout"] = 50
         
         # Add system resource info
-        if "system_resources" in self.coordinator.data:
-            resources = self.coordinator.data["system_resources"]
-            attrs["cpu_count"] = resources.get("cpu_count")
-            attrs["memory_total_gb"] = round(resources.get("memory_total", 0) / (1024**3), 2)
-            attrs["datadir_total_gb"] = round(resources.get("datadir_total", 0) / (1024**3), 2)
-            attrs["datadir_percent"] = round(resources.get("datadir_percent", 0), 2)
+        resources = data.get("system_resources")
+        if resources is not None:
+            attrs["cpu_count"] = resources.cpu_count
+            attrs["memory_total_gb"] = round((resources.memory_total or 0) * _GIB_INV, 2)
+            attrs["datadir_total_gb"] = round((resources.datadir_total or 0) * _GIB_INV, 2)
+            attrs["datadir_percent"] = round(resources.datadir_percent or 0, 2)
         
         # Add table lock statistics from global_status
-        if "global_status" in self.coordinator.data:
-            status = self.coordinator.data["global_status"]
-            try:
-                attrs["table_locks_immediate"] = int(status.get("Table_locks_immediate", 0))
-                attrs["table_locks_waited"] = int(status.get("Table_locks_waited", 0))
-            except (ValueError, TypeError):
-                pass
+        if "global_status_num" in data:
+            status = data["global_status_num"]
+            attrs["table_locks_immediate"] = status.get("Table_locks_immediate") or 0
+            attrs["table_locks_waited"] = status.get("Table_locks_waited") or 0
         
         return attrs
 
@@ -230,6 +383,8 @@ class MySQLServerInfoSensor(MySQLBaseSensor):
 class MySQLGlobalStatusSensor(MySQLBaseSensor):
     """MySQL global status metric sensor."""
     
+    __slots__ = ("_metric", "_category", "_metric_lower")
+    
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -238,81 +393,59 @@ class MySQLGlobalStatusSensor(MySQLBaseSensor):
         category: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, metric.lower(), metric.replace("_", " ").title())
+        spec = _METRIC_SPEC.get(metric) or _metric_spec(metric)
+        super().__init__(coordinator, entry, spec.sensor_type, spec.display_name)
         self._metric = metric
         self._category = category
+        # (metric, attribute key) pairs for the rest of the category
+        self._metric_lower = tuple(
+            (m, m.lower())
+            for m in coordinator.active_categories.get(category, ())
+            if m != metric
+        )
         self._attr_icon = SENSOR_ICONS.get(category, SENSOR_ICONS["default"])
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
         # Set unit of measurement
-        if metric in METRIC_UNITS["bytes"]:
-            self._attr_device_class = SensorDeviceClass.DATA_SIZE
-            self._attr_native_unit_of_measurement = UnitOfInformation.BYTES
-        elif metric in METRIC_UNITS["milliseconds"]:
-            self._attr_device_class = SensorDeviceClass.DURATION
-            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
-        elif metric in METRIC_UNITS["percentage"]:
-            self._attr_native_unit_of_measurement = PERCENTAGE
+        if spec.unit_spec is not None:
+            self._attr_device_class, self._attr_native_unit_of_measurement = (
+                spec.unit_spec
+            )
     
-    @property
-    def native_value(self) -> Optional[float]:
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> Optional[float]:
         """Return the state."""
-        if not self.coordinator.data or "global_status" not in self.coordinator.data:
+        if not data or "global_status_num" not in data:
             return None
         
-        value = self.coordinator.data["global_status"].get(self._metric)
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        return None
+        # Already numeric (or None) from the coordinator
+        return data["global_status_num"].get(self._metric)
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Return state attributes."""
         attrs = {
             "category": self._category,
             "metric": self._metric,
         }
         
-        # Add related metrics from the same category
-        if self.coordinator.data and "global_status" in self.coordinator.data:
-            status = self.coordinator.data["global_status"]
+        # Add related metrics from the same category, using the values the
+        # coordinator already cast; non-numeric ones are passed through raw
+        if data and "global_status_num" in data:
+            status = data["global_status"]
+            status_num = data["global_status_num"]
             
-            # Determine which metrics to include
-            if self._category == "cache":
-                related_metrics = QUERY_CACHE_METRICS
-            elif self._category == "replication":
-                related_metrics = REPLICATION_METRICS
-            else:
-                related_metrics = METRIC_CATEGORIES.get(self._category, [])
-            
-            for metric in related_metrics:
-                if metric != self._metric and metric in status:
-                    try:
-                        attrs[metric.lower()] = float(status[metric])
-                    except (ValueError, TypeError):
-                        attrs[metric.lower()] = status[metric]
+            attrs.update({
+                key: status[metric] if status_num[metric] is None else status_num[metric]
+                for metric, key in self._metric_lower
+                if metric in status
+            })
             
             # Add lock statistics for InnoDB metrics from global_status
             if self._category == "innodb":
-                # InnoDB lock metrics from global_status
-                lock_metrics = [
-                    "Innodb_row_lock_waits",
-                    "Innodb_row_lock_time",
-                    "Innodb_row_lock_time_avg",
-                    "Innodb_row_lock_time_max",
-                    "Innodb_row_lock_current_waits",
-                ]
-                
-                for metric in lock_metrics:
-                    value = status.get(metric)
-                    if value is not None:
-                        try:
-                            attrs[metric.lower()] = int(value)
-                        except (ValueError, TypeError):
-                            attrs[metric.lower()] = value
+                attrs.update({
+                    key: status[metric] if status_num[metric] is None else status_num[metric]
+                    for metric, key in _INNODB_LOCK_METRICS_LOWER
+                    if status.get(metric) is not None
+                })
         
         return attrs
 
@@ -320,44 +453,31 @@ class MySQLGlobalStatusSensor(MySQLBaseSensor):
 class MySQLConnectionErrorsSensor(MySQLBaseSensor):
     """MySQL connection errors aggregate sensor."""
     
+    __slots__ = ()
+    
     def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "connection_errors", "Connection Errors")
         self._attr_icon = SENSOR_ICONS["errors"]
         self._attr_state_class = SensorStateClass.MEASUREMENT
     
-    @property
-    def native_value(self) -> Optional[int]:
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> Optional[int]:
         """Return the total of all connection errors."""
-        if not self.coordinator.data or "global_status" not in self.coordinator.data:
+        if not data or "global_status_num" not in data:
             return None
         
-        status = self.coordinator.data["global_status"]
-        total = 0
-        
-        for error_metric in CONNECTION_ERROR_METRICS:
-            value = status.get(error_metric, 0)
-            try:
-                total += int(value)
-            except (ValueError, TypeError):
-                pass
-        
-        return total
+        status = data["global_status_num"]
+        return sum(_CE_GETTER(status))
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Return state attributes with individual error counts."""
         attrs = {}
         
-        if self.coordinator.data and "global_status" in self.coordinator.data:
-            status = self.coordinator.data["global_status"]
+        if data and "global_status_num" in data:
+            status = data["global_status_num"]
             
-            for error_metric in CONNECTION_ERROR_METRICS:
-                value = status.get(error_metric, 0)
-                try:
-                    attrs[error_metric.lower()] = int(value)
-                except (ValueError, TypeError):
-                    attrs[error_metric.lower()] = 0
+            for error_metric, key in _CONN_ERR_LOWER:
+                attrs[key] = status.get(error_metric) or 0
         
         return attrs
 
@@ -365,6 +485,14 @@ class MySQLConnectionErrorsSensor(MySQLBaseSensor):
 class MySQLSystemResourceSensor(MySQLBaseSensor):
     """MySQL system resource sensor."""
     
+    __slots__ = (
+        "_resource_type",
+        "_read_value",
+        "_is_cpu",
+        "_is_memory",
+        "_status_thresholds",
+    )
+    
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -375,66 +503,79 @@ class MySQLSystemResourceSensor(MySQLBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, f"system_{resource_type}", name)
         self._resource_type = resource_type
+        self._read_value = attrgetter(resource_type)
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = PERCENTAGE
         
-        if "cpu" in resource_type:
+        # Resolve the resource kind and its (warning, critical) thresholds once
+        self._is_cpu = "cpu" in resource_type
+        self._is_memory = not self._is_cpu and "memory" in resource_type
+        self._status_thresholds = None
+        if self._is_cpu:
             self._attr_icon = SENSOR_ICONS["cpu"]
-        elif "memory" in resource_type:
+            self._status_thresholds = (
+                RESOURCE_THRESHOLDS["cpu_warning"],
+                RESOURCE_THRESHOLDS["cpu_critical"],
+            )
+        elif self._is_memory:
             self._attr_icon = SENSOR_ICONS["memory"]
+            self._status_thresholds = (
+                RESOURCE_THRESHOLDS["memory_warning"],
+                RESOURCE_THRESHOLDS["memory_critical"],
+            )
     
-    @property
-    def native_value(self) -> Optional[float]:
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> Optional[float]:
         """Return the state."""
-        if not self.coordinator.data or "system_resources" not in self.coordinator.data:
+        if not data or data.get("system_resources") is None:
             return None
         
-        resources = self.coordinator.data["system_resources"]
-        value = resources.get(self._resource_type)
+        value = self._read_value(data["system_resources"])
         
         if value is not None:
             return round(float(value), 2)
         return None
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Return state attributes."""
-        if not self.coordinator.data or "system_resources" not in self.coordinator.data:
+        if not data or data.get("system_resources") is None:
             return {}
         
-        resources = self.coordinator.data["system_resources"]
+        resources = data["system_resources"]
         attrs = {}
         
         # Add relevant system resource data
-        if "cpu" in self._resource_type:
-            attrs["cpu_count"] = resources.get("cpu_count")
-            # Add threshold status
-            if self.native_value is not None:
-                if self.native_value >= RESOURCE_THRESHOLDS["cpu_critical"]:
-                    attrs["status"] = "critical"
-                elif self.native_value >= RESOURCE_THRESHOLDS["cpu_warning"]:
-                    attrs["status"] = "warning"
-                else:
-                    attrs["status"] = "normal"
-        elif "memory" in self._resource_type:
-            attrs["memory_total_gb"] = round(resources.get("memory_total", 0) / (1024**3), 2)
-            attrs["memory_used_gb"] = round(resources.get("memory_used", 0) / (1024**3), 2)
-            attrs["memory_available_gb"] = round(resources.get("memory_available", 0) / (1024**3), 2)
-            # Add threshold status
-            if self.native_value is not None:
-                if self.native_value >= RESOURCE_THRESHOLDS["memory_critical"]:
-                    attrs["status"] = "critical"
-                elif self.native_value >= RESOURCE_THRESHOLDS["memory_warning"]:
-                    attrs["status"] = "warning"
-                else:
-                    attrs["status"] = "normal"
+        if self._is_cpu:
+            attrs["cpu_count"] = resources.cpu_count
+        elif self._is_memory:
+            attrs["memory_total_gb"] = round((resources.memory_total or 0) * _GIB_INV, 2)
+            attrs["memory_used_gb"] = round((resources.memory_used or 0) * _GIB_INV, 2)
+            attrs["memory_available_gb"] = round(
+                (resources.memory_available or 0) * _GIB_INV, 2
+            )
         
         return attrs
+    
+    def _compute_snapshot(
+        self, data: Optional[Dict[str, Any]]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Classify the state against the thresholds without reading it twice."""
+        value = self._compute_state(data)
+        attrs = self._build_attributes(data)
+        
+        # Add threshold status
+        if attrs and value is not None and self._status_thresholds is not None:
+            attrs["status"] = _RESOURCE_STATUS[
+                bisect_right(self._status_thresholds, value)
+            ]
+        
+        return value, attrs
 
 
 class MySQLDatabaseSensor(MySQLBaseSensor):
     """MySQL database metric sensor."""
     
+    __slots__ = ("_db_name", "_metric_type")
+    
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -463,53 +604,175 @@ class MySQLDatabaseSensor(MySQLBaseSensor):
         else:  # total_rows
             self._attr_icon = SENSOR_ICONS["rows"]
     
-    @property
-    def native_value(self) -> Optional[float]:
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> Optional[float]:
         """Return the state."""
-        if not self.coordinator.data or "database_sizes" not in self.coordinator.data:
+        if not data or "database_sizes" not in data:
             return None
         
-        db_data = self.coordinator.data["database_sizes"].get(self._db_name, {})
+        db_data = data["database_sizes"].get(self._db_name, {})
         value = db_data.get(self._metric_type)
         
         if value is not None:
             return float(value)
         return None
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Return state attributes."""
-        if not self.coordinator.data or "database_sizes" not in self.coordinator.data:
+        if not data or "database_sizes" not in data:
             return {}
         
-        db_data = self.coordinator.data["database_sizes"].get(self._db_name, {})
+        db_data = data["database_sizes"].get(self._db_name, {})
+        # Add all database metrics in one copy
         attrs = {
             "database": self._db_name,
+            **db_data,
         }
         
-        # Add all database metrics
-        for key, value in db_data.items():
-            attrs[key] = value
-        
         # Add table statistics if available
-        if "table_stats" in self.coordinator.data:
-            table_stats = self.coordinator.data["table_stats"]
+        if "table_stats" in data:
+            table_stats = data["table_stats"]
             
-            # Find largest tables for this database
-            if "largest_tables" in table_stats:
-                db_tables = [
-                    t for t in table_stats["largest_tables"]
-                    if t.get("table_schema") == self._db_name
-                ]
-                if db_tables:
-                    attrs["largest_tables"] = db_tables[:5]  # Top 5 tables
+            # Largest tables for this database, grouped by the coordinator
+            db_tables = table_stats.get("largest_by_schema", {}).get(self._db_name)
+            if db_tables:
+                attrs["largest_tables"] = db_tables  # Top 5 tables
         
         return attrs
 
 
+def _query_cache_hit_rate(data: Dict[str, Any]) -> Optional[float]:
+    cache_info = data.get("query_cache", {})
+    if cache_info.get("enabled"):
+        return round(cache_info.get("hit_rate", 0), 2)
+    return None
+
+
+def _buffer_pool_hit_rate(data: Dict[str, Any]) -> float:
+    buffer_pool = data.get("buffer_pool", {})
+    return round(buffer_pool.get("avg_hit_rate", 0), 2)
+
+
+def _connections_usage(data: Dict[str, Any]) -> float:
+    conn_pool = data.get("connection_pool", {})
+    return round(conn_pool.get("connection_usage_pct", 0), 2)
+
+
+def _slow_query_logs(data: Dict[str, Any]) -> int:
+    # global_status에서 Slow_queries 값을 가져옴
+    status = data.get("global_status_num") or {}
+    return status.get("Slow_queries") or 0
+
+
+def _transaction_count(data: Dict[str, Any]) -> int:
+    transactions = data.get("transactions", {})
+    return transactions.get("transaction_count", 0)
+
+
+def _query_cache_attrs(data: Dict[str, Any]) -> Dict[str, Any]:
+    cache_info = data.get("query_cache", {})
+    if not cache_info.get("enabled"):
+        return {}
+    return {
+        "hits": cache_info.get("hits"),
+        "inserts": cache_info.get("inserts"),
+        "queries_in_cache": cache_info.get("queries_in_cache"),
+        "free_memory": cache_info.get("free_memory"),
+    }
+
+
+def _buffer_pool_attrs(data: Dict[str, Any]) -> Dict[str, Any]:
+    buffer_pool = data.get("buffer_pool", {})
+    return {
+        "total_size": buffer_pool.get("total_size"),
+        "total_free": buffer_pool.get("total_free"),
+        "usage_pct": buffer_pool.get("usage_pct"),
+        "dirty_pct": buffer_pool.get("dirty_pct"),
+    }
+
+
+def _connections_attrs(data: Dict[str, Any]) -> Dict[str, Any]:
+    conn_pool = data.get("connection_pool", {})
+    return {
+        "total_connections": conn_pool.get("total_connections"),
+        "active_connections": conn_pool.get("active_connections"),
+        "idle_connections": conn_pool.get("idle_connections"),
+        "max_connections": conn_pool.get("max_connections"),
+        "max_used_connections": conn_pool.get("max_used_connections"),
+    }
+
+
+def _slow_query_attrs(data: Dict[str, Any]) -> Dict[str, Any]:
+    # slow_queries 데이터에서 정보 가져오기
+    slow_queries = data.get("slow_queries", {})
+    attrs = {
+        "enabled": slow_queries.get("enabled"),
+        "long_query_time": slow_queries.get("long_query_time"),
+        "log_file": slow_queries.get("slow_query_log_file"),
+    }
+    
+    # Add current lock wait count from lock_waits data
+    if "lock_waits" in data:
+        lock_data = data["lock_waits"]
+        current_waits = lock_data.get("current_lock_waits", [])
+        attrs["current_lock_waits"] = len(current_waits)
+    
+    # Add slow query related global status
+    if "global_status" in data:
+        status = data["global_status"]
+        attrs["questions"] = status.get("Questions")
+        attrs["queries"] = status.get("Queries")
+    
+    return attrs
+
+
+def _transaction_attrs(data: Dict[str, Any]) -> Dict[str, Any]:
+    transactions = data.get("transactions", {})
+    return {
+        "long_running_count": len(transactions.get("long_running_transactions", [])),
+        "isolation_level": transactions.get("default_isolation_level"),
+        "commits": transactions.get("Com_commit"),
+        "rollbacks": transactions.get("Com_rollback"),
+    }
+
+
+_PERF_NAME_MAP = {
+    "query_cache_hit_rate": "Query Cache Hit Rate",
+    "buffer_pool_hit_rate": "Buffer Pool Hit Rate",
+    "connections_usage": "Connections Usage",
+    "slow_query_logs": "Slow Query Logs",  # 변경됨
+    "transaction_count": "Active Transactions",
+}
+# metric_type -> (unit, icon)
+_PERF_META = {
+    "query_cache_hit_rate": (PERCENTAGE, "mdi:gauge"),
+    "buffer_pool_hit_rate": (PERCENTAGE, "mdi:gauge"),
+    "connections_usage": (PERCENTAGE, "mdi:gauge"),
+    "slow_query_logs": (None, "mdi:counter"),
+    "transaction_count": (None, "mdi:counter"),
+}
+# metric_type -> state from coordinator data
+_PERF_VALUE = {
+    "query_cache_hit_rate": _query_cache_hit_rate,
+    "buffer_pool_hit_rate": _buffer_pool_hit_rate,
+    "connections_usage": _connections_usage,
+    "slow_query_logs": _slow_query_logs,
+    "transaction_count": _transaction_count,
+}
+# metric_type -> state attributes from coordinator data
+_PERF_ATTRS = {
+    "query_cache_hit_rate": _query_cache_attrs,
+    "buffer_pool_hit_rate": _buffer_pool_attrs,
+    "connections_usage": _connections_attrs,
+    "slow_query_logs": _slow_query_attrs,
+    "transaction_count": _transaction_attrs,
+}
+
+
 class MySQLPerformanceSensor(MySQLBaseSensor):
     """MySQL performance metric sensor."""
     
+    __slots__ = ("_compute", "_compute_attrs")
+    
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -517,170 +780,64 @@ class MySQLPerformanceSensor(MySQLBaseSensor):
         metric_type: str,
     ) -> None:
         """Initialize the sensor."""
-        name_map = {
-            "query_cache_hit_rate": "Query Cache Hit Rate",
-            "buffer_pool_hit_rate": "Buffer Pool Hit Rate",
-            "connections_usage": "Connections Usage",
-            "slow_query_logs": "Slow Query Logs",  # 변경됨
-            "transaction_count": "Active Transactions",
-        }
-        super().__init__(coordinator, entry, metric_type, name_map.get(metric_type, metric_type))
-        self._metric_type = metric_type
+        super().__init__(coordinator, entry, metric_type, _PERF_NAME_MAP[metric_type])
+        # Per-metric value and attribute builders, resolved once
+        self._compute = _PERF_VALUE[metric_type]
+        self._compute_attrs = _PERF_ATTRS[metric_type]
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-        if "rate" in metric_type or "usage" in metric_type:
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_icon = "mdi:gauge"
-        elif "count" in metric_type or "logs" in metric_type:
-            self._attr_icon = "mdi:counter"
+        self._attr_native_unit_of_measurement, self._attr_icon = _PERF_META[metric_type]
     
-    @property
-    def native_value(self) -> Optional[float]:
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> Optional[float]:
         """Return the state."""
-        if not self.coordinator.data:
+        if not data:
             return None
-        
-        if self._metric_type == "query_cache_hit_rate":
-            cache_info = self.coordinator.data.get("query_cache", {})
-            if cache_info.get("enabled"):
-                return round(cache_info.get("hit_rate", 0), 2)
-            
-        elif self._metric_type == "buffer_pool_hit_rate":
-            buffer_pool = self.coordinator.data.get("buffer_pool", {})
-            return round(buffer_pool.get("avg_hit_rate", 0), 2)
-            
-        elif self._metric_type == "connections_usage":
-            conn_pool = self.coordinator.data.get("connection_pool", {})
-            return round(conn_pool.get("connection_usage_pct", 0), 2)
-            
-        elif self._metric_type == "slow_query_logs":
-            # global_status에서 Slow_queries 값을 가져옴
-            if "global_status" in self.coordinator.data:
-                status = self.coordinator.data["global_status"]
-                slow_queries = status.get("Slow_queries", 0)
-                try:
-                    return int(slow_queries)
-                except (ValueError, TypeError):
-                    return 0
-            return 0
-            
-        elif self._metric_type == "transaction_count":
-            transactions = self.coordinator.data.get("transactions", {})
-            return transactions.get("transaction_count", 0)
-        
-        return None
+        return self._compute(data)
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Return state attributes."""
-        attrs = {}
-        
-        if not self.coordinator.data:
-            return attrs
-        
-        if self._metric_type == "query_cache_hit_rate":
-            cache_info = self.coordinator.data.get("query_cache", {})
-            if cache_info.get("enabled"):
-                attrs.update({
-                    "hits": cache_info.get("hits"),
-                    "inserts": cache_info.get("inserts"),
-                    "queries_in_cache": cache_info.get("queries_in_cache"),
-                    "free_memory": cache_info.get("free_memory"),
-                })
-                
-        elif self._metric_type == "buffer_pool_hit_rate":
-            buffer_pool = self.coordinator.data.get("buffer_pool", {})
-            attrs.update({
-                "total_size": buffer_pool.get("total_size"),
-                "total_free": buffer_pool.get("total_free"),
-                "usage_pct": buffer_pool.get("usage_pct"),
-                "dirty_pct": buffer_pool.get("dirty_pct"),
-            })
-            
-        elif self._metric_type == "connections_usage":
-            conn_pool = self.coordinator.data.get("connection_pool", {})
-            attrs.update({
-                "total_connections": conn_pool.get("total_connections"),
-                "active_connections": conn_pool.get("active_connections"),
-                "idle_connections": conn_pool.get("idle_connections"),
-                "max_connections": conn_pool.get("max_connections"),
-                "max_used_connections": conn_pool.get("max_used_connections"),
-            })
-            
-        elif self._metric_type == "slow_query_logs":
-            # slow_queries 데이터에서 정보 가져오기
-            slow_queries = self.coordinator.data.get("slow_queries", {})
-            attrs.update({
-                "enabled": slow_queries.get("enabled"),
-                "long_query_time": slow_queries.get("long_query_time"),
-                "log_file": slow_queries.get("slow_query_log_file"),
-            })
-            
-            # Add current lock wait count from lock_waits data
-            if "lock_waits" in self.coordinator.data:
-                lock_data = self.coordinator.data["lock_waits"]
-                current_waits = lock_data.get("current_lock_waits", [])
-                attrs["current_lock_waits"] = len(current_waits)
-            
-            # Add slow query related global status
-            if "global_status" in self.coordinator.data:
-                status = self.coordinator.data["global_status"]
-                attrs["questions"] = status.get("Questions")
-                attrs["queries"] = status.get("Queries")
-            
-        elif self._metric_type == "transaction_count":
-            transactions = self.coordinator.data.get("transactions", {})
-            attrs.update({
-                "long_running_count": len(transactions.get("long_running_transactions", [])),
-                "isolation_level": transactions.get("default_isolation_level"),
-                "commits": transactions.get("Com_commit"),
-                "rollbacks": transactions.get("Com_rollback"),
-            })
-        
-        return attrs
+        if not data:
+            return {}
+        return self._compute_attrs(data)
 
 
 class MySQLReplicationSensor(MySQLBaseSensor):
     """MySQL replication status sensor."""
     
+    __slots__ = ()
+    
     def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "replication", "Replication Status")
         self._attr_icon = SENSOR_ICONS["replication"]
     
-    @property
-    def native_value(self) -> str:
+    def _compute_state(self, data: Optional[Dict[str, Any]]) -> Optional[str]:
         """Return the state."""
-        if not self.coordinator.data or "replication_status" not in self.coordinator.data:
+        if not data or "replication_status" not in data:
             return "Not Configured"
         
-        repl_data = self.coordinator.data["replication_status"]
+        repl_data = data["replication_status"] or {}
         
-        if repl_data.get("slave"):
-            slave_data = repl_data["slave"]
-            io_running = slave_data.get("Slave_IO_Running") == "Yes"
-            sql_running = slave_data.get("Slave_SQL_Running") == "Yes"
-            
-            if io_running and sql_running:
-                return "Slave Running"
-            elif io_running or sql_running:
-                return "Slave Partial"
-            else:
-                return "Slave Stopped"
+        slave_data = repl_data.get("slave")
+        if slave_data:
+            # IO thread is the high bit, SQL thread the low bit
+            state = (
+                (slave_data.get("Slave_IO_Running") == "Yes") * 2
+                + (slave_data.get("Slave_SQL_Running") == "Yes")
+            )
+            return _REPL_STATE[state]
         
         if repl_data.get("master"):
             return "Master"
         
         return "Not Configured"
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Return state attributes."""
-        if not self.coordinator.data or "replication_status" not in self.coordinator.data:
+        if not data or "replication_status" not in data:
             return {}
         
         attrs = {}
-        repl_data = self.coordinator.data["replication_status"]
+        repl_data = data["replication_status"]
         
         if repl_data.get("master"):
             master = repl_data["master"]
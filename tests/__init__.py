@@ -0,0 +1 @@
+"""Tests for the MySQL Monitor integration."""
@@ -0,0 +1,30 @@
+"""Tests for the MySQL Monitor config flow."""
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.mysql_monitor.config_flow import MySQLMonitorOptionsFlow
+from custom_components.mysql_monitor.const import CONF_LEGACY_SPLIT_DB_SENSORS
+
+
+def _suggested_values(options):
+    flow = MySQLMonitorOptionsFlow(SimpleNamespace(options=options))
+    result = asyncio.run(flow.async_step_init())
+    return {
+        str(key): key.description["suggested_value"]
+        for key in result["data_schema"].schema
+        if key.description and "suggested_value" in key.description
+    }
+
+
+def test_options_form_keeps_split_sensors_for_existing_entries():
+    """Entries without the legacy split option show it as on."""
+    suggested = _suggested_values({"scan_interval": 60})
+    
+    assert suggested[CONF_LEGACY_SPLIT_DB_SENSORS] is True
+
+
+def test_options_form_shows_stored_split_option():
+    """A stored value wins over the fallback."""
+    suggested = _suggested_values({CONF_LEGACY_SPLIT_DB_SENSORS: False})
+    
+    assert suggested[CONF_LEGACY_SPLIT_DB_SENSORS] is False
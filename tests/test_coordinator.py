@@ -0,0 +1,228 @@
+"""Tests for the MySQL Monitor data coordinator."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pymysql
+import pytest
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.mysql_monitor import MySQLDataCoordinator, _maybe_number
+from custom_components.mysql_monitor.const import SECTION_TTLS
+from custom_components.mysql_monitor.mysql_client import SystemResources
+
+
+class FakeClient:
+    """Client stand-in whose collectors return empty sections."""
+    
+    def __init__(self):
+        self.snapshot_error = None
+        self.errors = {}
+        self.results = {}
+        self.calls = []
+    
+    def refresh_snapshots(self):
+        if self.snapshot_error is not None:
+            raise self.snapshot_error
+        return {"Uptime": "100", "Questions": "5"}, {"max_connections": "151"}
+    
+    def __getattr__(self, name):
+        if not name.startswith("get_"):
+            raise AttributeError(name)
+        
+        def collector(*args):
+            self.calls.append(name)
+            if name in self.errors:
+                raise self.errors[name]
+            if name in self.results:
+                return self.results[name]
+            if name == "get_system_resources":
+                return SystemResources()
+            if name == "get_process_list":
+                return []
+            return {}
+        
+        return collector
+
+
+def _hass():
+    """Return a hass stand-in that runs executor jobs inline."""
+    hass = MagicMock()
+    
+    async def async_add_executor_job(target, *args):
+        return target(*args)
+    
+    hass.async_add_executor_job = async_add_executor_job
+    return hass
+
+
+def _coordinator(client):
+    entry = SimpleNamespace(
+        entry_id="test",
+        data={"host": "localhost", "port": 3306},
+        options={},
+    )
+    return MySQLDataCoordinator(_hass(), client, entry)
+
+
+def _refresh(coordinator):
+    return asyncio.run(coordinator._async_update_data())
+
+
+def test_update_fails_when_server_unreachable():
+    """A refused connection fails the refresh instead of publishing zeros."""
+    client = FakeClient()
+    client.snapshot_error = pymysql.err.OperationalError(
+        2003, "Can't connect to MySQL server on 'localhost'"
+    )
+    
+    with pytest.raises(UpdateFailed):
+        _refresh(_coordinator(client))
+
+
+def test_update_fails_when_connection_lost_in_collector():
+    """A connection error raised by any collector fails the refresh."""
+    client = FakeClient()
+    client.errors["get_process_list"] = pymysql.err.OperationalError(
+        2013, "Lost connection to MySQL server during query"
+    )
+    
+    with pytest.raises(UpdateFailed):
+        _refresh(_coordinator(client))
+
+
+def test_section_error_only_empties_that_section():
+    """A denied query on one section keeps the rest of the refresh."""
+    client = FakeClient()
+    client.errors["get_process_list"] = pymysql.err.OperationalError(
+        1227, "Access denied; you need the PROCESS privilege"
+    )
+    
+    data = _refresh(_coordinator(client))
+    
+    assert data["process_list"] == []
+    assert data["global_status"]["Uptime"] == "100"
+
+
+def test_first_refresh_not_ready_when_server_unreachable():
+    """Setup is retried instead of succeeding against a down server."""
+    client = FakeClient()
+    client.snapshot_error = pymysql.err.OperationalError(
+        2003, "Can't connect to MySQL server on 'localhost'"
+    )
+    
+    async def first_refresh():
+        await _coordinator(client).async_config_entry_first_refresh()
+    
+    with pytest.raises(ConfigEntryNotReady):
+        asyncio.run(first_refresh())
+
+
+def test_section_ttl_serves_cache_then_refreshes(monkeypatch):
+    """performance_data is reused within its TTL and queried once it expires."""
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "custom_components.mysql_monitor.time.monotonic", lambda: clock[0]
+    )
+    client = FakeClient()
+    coordinator = _coordinator(client)
+    ttl = SECTION_TTLS["performance_data"]
+    interval = coordinator.update_interval.total_seconds()
+    
+    _refresh(coordinator)
+    assert client.calls.count("get_performance_data") == 1
+    
+    # Cache hit: the next poll reuses the cached section
+    clock[0] += interval
+    data = _refresh(coordinator)
+    assert client.calls.count("get_performance_data") == 1
+    assert data["performance_data"] == {}
+    
+    # Cache miss: a poll arriving slightly before the TTL still refreshes
+    clock[0] = 1000.0 + ttl - 1
+    _refresh(coordinator)
+    assert client.calls.count("get_performance_data") == 2
+
+
+def test_static_data_fetched_right_after_boot(monkeypatch):
+    """A small monotonic clock (early after boot) still fetches server info."""
+    monkeypatch.setattr(
+        "custom_components.mysql_monitor.time.monotonic", lambda: 90.0
+    )
+    client = FakeClient()
+    
+    data = _refresh(_coordinator(client))
+    
+    assert "get_server_info" in client.calls
+    assert data["server_info"] is not None
+
+
+def test_heavy_sections_fetched_right_after_boot(monkeypatch):
+    """Database sizes are scanned on the first refresh even early after boot."""
+    monkeypatch.setattr(
+        "custom_components.mysql_monitor.time.monotonic", lambda: 90.0
+    )
+    client = FakeClient()
+    
+    _refresh(_coordinator(client))
+    
+    assert "get_database_sizes" in client.calls
+    assert "get_table_statistics" in client.calls
+    assert "get_storage_engine_stats" in client.calls
+
+
+def test_failed_heavy_section_backs_off_without_dropping_others(monkeypatch):
+    """One failing heavy scan neither reruns the others nor discards them."""
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "custom_components.mysql_monitor.time.monotonic", lambda: clock[0]
+    )
+    client = FakeClient()
+    client.results["get_database_sizes"] = {"shop": {"total_size": 1024}}
+    client.errors["get_storage_engine_stats"] = pymysql.err.ProgrammingError(
+        1064, "You have an error in your SQL syntax"
+    )
+    coordinator = _coordinator(client)
+    
+    for _ in range(3):
+        data = _refresh(coordinator)
+        clock[0] += 60
+    
+    assert client.calls.count("get_database_sizes") == 1
+    assert client.calls.count("get_table_statistics") == 1
+    assert client.calls.count("get_storage_engine_stats") == 1
+    assert data["database_sizes"] == {"shop": {"total_size": 1024}}
+    assert data["storage_engines"] == {}
+    
+    # The failed section is retried once its own interval has passed
+    clock[0] = 1000.0 + coordinator.heavy_scan_interval
+    _refresh(coordinator)
+    assert client.calls.count("get_storage_engine_stats") == 2
+
+
+def test_maybe_number_handles_signs_and_non_strings():
+    """Negative counters stay integers and missing values become None."""
+    assert _maybe_number("42") == 42
+    assert _maybe_number("-3") == -3
+    assert isinstance(_maybe_number("-3"), int)
+    assert _maybe_number("0.75") == 0.75
+    assert _maybe_number("ON") is None
+    assert _maybe_number(None) is None
+
+
+def test_section_ttl_ignores_sections_not_scheduled(monkeypatch):
+    """A TTL on a heavy section that is not due this poll is skipped."""
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "custom_components.mysql_monitor.time.monotonic", lambda: clock[0]
+    )
+    monkeypatch.setitem(SECTION_TTLS, "storage_engines", 3600)
+    client = FakeClient()
+    coordinator = _coordinator(client)
+    
+    _refresh(coordinator)
+    clock[0] += coordinator.update_interval.total_seconds()
+    _refresh(coordinator)
+    
+    assert client.calls.count("get_storage_engine_stats") == 1
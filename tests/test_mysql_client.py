@@ -0,0 +1,103 @@
+"""Tests for the MySQL client."""
+from collections import namedtuple
+from contextlib import contextmanager
+
+import pytest
+
+from custom_components.mysql_monitor import mysql_client
+from custom_components.mysql_monitor.mysql_client import MySQLClient
+
+
+class FakeStreamCursor:
+    """Unbuffered cursor stand-in that returns () at EOF, like PyMySQL."""
+    
+    def __init__(self, rows, chunk=2):
+        self._rows = list(rows)
+        self._chunk = chunk
+        self.eof_reads = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def execute(self, sql, params=None):
+        self.sql = sql
+    
+    def fetchmany(self):
+        chunk, self._rows = self._rows[:self._chunk], self._rows[self._chunk:]
+        if not chunk:
+            self.eof_reads += 1
+            if self.eof_reads > 1:
+                raise AssertionError("fetchmany() called again after EOF")
+            return ()
+        return tuple(chunk)
+
+
+class FakeConnection:
+    """Connection stand-in handing out a single cursor."""
+    
+    open = True
+    
+    def __init__(self, cursor):
+        self._cursor = cursor
+    
+    def cursor(self, cursor_class=None):
+        return self._cursor
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Return a client that never opens a real connection."""
+    return MySQLClient("localhost", 3306, "user", "password")
+
+
+def _use_cursor(monkeypatch, client, cursor):
+    @contextmanager
+    def borrow():
+        yield FakeConnection(cursor)
+    
+    monkeypatch.setattr(client, "_borrow", borrow)
+
+
+def test_stream_query_stops_at_eof(monkeypatch, client):
+    """Rows are streamed until fetchmany() returns an empty tuple."""
+    rows = [{"id": i} for i in range(5)]
+    cursor = FakeStreamCursor(rows)
+    _use_cursor(monkeypatch, client, cursor)
+    
+    assert list(client._stream_query("SELECT id FROM t")) == rows
+    assert cursor.eof_reads == 1
+
+
+def test_read_variables_stops_at_eof():
+    """SHOW STATUS/VARIABLES rows are collected up to the empty tuple."""
+    cursor = FakeStreamCursor([("Uptime", "10"), ("Questions", "5"), ("Threads_connected", "2")])
+    
+    assert MySQLClient._read_variables(cursor) == {
+        "Uptime": "10",
+        "Questions": "5",
+        "Threads_connected": "2",
+    }
+    assert cursor.eof_reads == 1
+
+
+_CpuTimes = namedtuple("_CpuTimes", "user system idle")
+
+
+def test_cpu_percent_is_sampled_per_client(monkeypatch):
+    """Each client measures CPU usage against its own previous sample."""
+    samples = iter([
+        _CpuTimes(10.0, 0.0, 90.0),
+        _CpuTimes(10.0, 0.0, 90.0),
+        _CpuTimes(60.0, 0.0, 140.0),
+        _CpuTimes(60.0, 0.0, 140.0),
+    ])
+    monkeypatch.setattr(mysql_client.psutil, "cpu_times", lambda: next(samples))
+    first = MySQLClient("localhost", 3306, "user", "password")
+    second = MySQLClient("localhost", 3306, "user", "password")
+    
+    # Without a shared baseline, the second reading covers the same span
+    assert first._sample_cpu_percent() == 50.0
+    assert second._sample_cpu_percent() == 50.0